@@ -38,7 +38,7 @@ from flask import Flask, send_from_directory, send_file
 from flask_socketio import SocketIO
 from flask_cors import CORS
 from routes import register_routes
-from services.state import initialize_state
+from services.state import initialize_state, flush_pending_saves
 from services.printer_manager import start_background_tasks, close_connection_pool
 from utils.config import Config
 import asyncio
@@ -252,6 +252,7 @@ def cleanup_on_exit():
 
         # Run the async cleanup
         loop.run_until_complete(close_connection_pool())
+        flush_pending_saves()
         loop.close()
 
         logging.info("Cleanup completed successfully")
@@ -13,10 +13,11 @@ from .ejection_codes import register_ejection_codes_routes
 from services.state import (
     get_ejection_paused, set_ejection_paused,
     PRINTERS, ORDERS,
-    printers_rwlock, orders_lock, filament_lock,
+    printers_rwlock, orders_lock,
     ReadLock, WriteLock, SafeLock,
-    save_data, load_data, PRINTERS_FILE, ORDERS_FILE, TOTAL_FILAMENT_FILE,
-    encrypt_api_key, sanitize_group_name
+    save_data, PRINTERS_FILE, ORDERS_FILE,
+    encrypt_api_key, sanitize_group_name, rebuild_printer_indexes, mark_orders_changed,
+    get_total_filament_g
 )
 from services.printer_manager import prepare_printer_data_for_broadcast, start_background_distribution, extract_filament_from_file
 from services.default_settings import load_default_settings, save_default_settings
@@ -120,9 +121,7 @@ def register_routes(app, socketio):
     def api_system_stats():
         """API: Get system statistics"""
         try:
-            with SafeLock(filament_lock):
-                filament_data = load_data(TOTAL_FILAMENT_FILE, {"total_filament_used_g": 0})
-                total_filament_kg = filament_data.get("total_filament_used_g", 0) / 1000
+            total_filament_kg = get_total_filament_g() / 1000
 
             with ReadLock(printers_rwlock):
                 printers_count = len(PRINTERS)
@@ -168,9 +167,7 @@ def register_routes(app, socketio):
     def api_system_filament():
         """API: Get total filament usage"""
         try:
-            with SafeLock(filament_lock):
-                filament_data = load_data(TOTAL_FILAMENT_FILE, {"total_filament_used_g": 0})
-                total_filament_kg = filament_data.get("total_filament_used_g", 0) / 1000
+            total_filament_kg = get_total_filament_g() / 1000
             return jsonify({'total': total_filament_kg})
         except Exception as e:
             return jsonify({'error': str(e)}), 500
@@ -457,6 +454,7 @@ def register_routes(app, socketio):
 
             with WriteLock(printers_rwlock):
                 PRINTERS.append(new_printer)
+                rebuild_printer_indexes()
                 save_data(PRINTERS_FILE, PRINTERS)
 
             # Try to connect Bambu printers immediately (same as form-based add)
@@ -518,6 +516,7 @@ def register_routes(app, socketio):
                                 printer['api_key'] = encrypt_api_key(data['api_key'])
                         if 'name' in data and data['name'] != printer_name:
                             printer['name'] = data['name']
+                        rebuild_printer_indexes()
                         save_data(PRINTERS_FILE, PRINTERS)
                         # Reconnect Bambu printer if connection details changed
                         if needs_reconnect and printer.get('type') == 'bambu':
@@ -541,6 +540,7 @@ def register_routes(app, socketio):
                 for i, printer in enumerate(PRINTERS):
                     if printer['name'] == printer_name:
                         PRINTERS.pop(i)
+                        rebuild_printer_indexes()
                         save_data(PRINTERS_FILE, PRINTERS)
                         return jsonify({'success': True, 'message': f'Printer {printer_name} deleted'})
             return jsonify({'error': 'Printer not found'}), 404
@@ -707,6 +707,7 @@ def register_routes(app, socketio):
                     'from_new_orders': True
                 }
                 ORDERS.append(order)
+                mark_orders_changed()
                 save_data(ORDERS_FILE, ORDERS)
                 logging.info(f"Created order {order_id}: {order_name or filename}, qty={quantity}")
                 debug_log('cooldown', f"Order {order_id} created with cooldown_temp={cooldown_temp}")
@@ -6,9 +6,11 @@ from services.state import (
     PRINTERS, TOTAL_FILAMENT_CONSUMPTION, ORDERS,
     save_data, logging, orders_lock, filament_lock, printers_rwlock, SafeLock, ReadLock, get_order_lock,
     ORDERS_FILE,
-    validate_gcode_file, sanitize_group_name
+    validate_gcode_file, sanitize_group_name, mark_orders_changed
+)
+from services.printer_manager import (
+    extract_filament_from_file, start_background_distribution, prepare_printer_data_for_broadcast, emit_full_status
 )
-from services.printer_manager import extract_filament_from_file, start_background_distribution, prepare_printer_data_for_broadcast
 from services.default_settings import load_default_settings, save_default_settings
 from utils.logger import debug_log
 
@@ -105,6 +107,7 @@ def register_order_routes(app, socketio):
                 'from_new_orders': True
             }
             ORDERS.append(order)
+            mark_orders_changed()
             save_data(ORDERS_FILE, ORDERS)
             logging.info(f"Created order {order_id}: {filename}, qty={quantity}")
             debug_log('cooldown', f"Order {order_id} created with cooldown_temp={cooldown_temp}")
@@ -206,7 +209,7 @@ def register_order_routes(app, socketio):
                     orders_data = ORDERS.copy()
                     with ReadLock(printers_rwlock):
                         printers_copy = prepare_printer_data_for_broadcast(PRINTERS)
-                        socketio.emit('status_update', {'printers': printers_copy, 'total_filament': total_filament, 'orders': orders_data})
+                        emit_full_status(socketio, {'printers': printers_copy, 'total_filament': total_filament, 'orders': orders_data})
                     return '', 200
             logging.error(f"Failed to move order {order_id} up: not found or already at top")
             return 'Order not found or already at top', 400
@@ -227,7 +230,7 @@ def register_order_routes(app, socketio):
                     orders_data = ORDERS.copy()
                     with ReadLock(printers_rwlock):
                         printers_copy = prepare_printer_data_for_broadcast(PRINTERS)
-                        socketio.emit('status_update', {'printers': printers_copy, 'total_filament': total_filament, 'orders': orders_data})
+                        emit_full_status(socketio, {'printers': printers_copy, 'total_filament': total_filament, 'orders': orders_data})
                     return '', 200
             logging.error(f"Failed to move order {order_id} down: not found or already at bottom")
             return 'Order not found or already at bottom', 400
@@ -242,6 +245,7 @@ def register_order_routes(app, socketio):
                     if compare_order_ids(order['id'], order_id):
                         # Hard delete the order by removing it from the list
                         ORDERS.pop(i)
+                        mark_orders_changed()
                         save_data(ORDERS_FILE, ORDERS)
                         logging.debug(f"Hard deleted order {order_id}. Remaining ORDERS IDs: {[o['id'] for o in ORDERS]}")
 
@@ -250,7 +254,7 @@ def register_order_routes(app, socketio):
                         orders_data = ORDERS.copy()
                         with ReadLock(printers_rwlock):
                             printers_copy = prepare_printer_data_for_broadcast(PRINTERS)
-                            socketio.emit('status_update', {'printers': printers_copy, 'total_filament': total_filament, 'orders': orders_data})
+                            emit_full_status(socketio, {'printers': printers_copy, 'total_filament': total_filament, 'orders': orders_data})
 
                         flash(f"✅ Order {order_id} permanently deleted")
                         return redirect(url_for('index'))
@@ -310,7 +314,7 @@ def register_order_routes(app, socketio):
                             with ReadLock(printers_rwlock):
                                 printers_data = prepare_printer_data_for_broadcast(PRINTERS)
 
-                            socketio.emit('status_update', {
+                            emit_full_status(socketio, {
                                 'printers': printers_data,
                                 'total_filament': total_filament,
                                 'orders': ORDERS.copy()
@@ -10,11 +10,13 @@ from services.state import (
     PRINTERS, TOTAL_FILAMENT_CONSUMPTION, ORDERS,
     save_data, encrypt_api_key, decrypt_api_key,
     logging, orders_lock, filament_lock, printers_rwlock, SafeLock, ReadLock, WriteLock,
-    PRINTERS_FILE, validate_gcode_file,
+    PRINTERS_FILE, validate_gcode_file, rebuild_printer_indexes,
     register_task, update_task_progress, complete_task,
     sanitize_group_name
 )
-from services.printer_manager import start_background_distribution, send_print_to_printer, prepare_printer_data_for_broadcast
+from services.printer_manager import (
+    start_background_distribution, send_print_to_printer, prepare_printer_data_for_broadcast, emit_full_status
+)
 from utils.config import Config
 import copy
 # Bambu printer support
@@ -248,6 +250,7 @@ def add_printer():
 
     with WriteLock(printers_rwlock):
         PRINTERS.append(new_printer)
+        rebuild_printer_indexes()
         save_data(PRINTERS_FILE, PRINTERS)
 
     flash(f"{name} added successfully")
@@ -321,6 +324,7 @@ def add_printers_bulk():
 
         with WriteLock(printers_rwlock):
             PRINTERS.extend(new_printers)
+            rebuild_printer_indexes()
             save_data(PRINTERS_FILE, PRINTERS)
 
         message = f"{len(new_printers)} printers added successfully"
@@ -342,6 +346,7 @@ def delete_printer(printer_id):
     with WriteLock(printers_rwlock):
         if 0 <= printer_id < len(PRINTERS):
             deleted_printer = PRINTERS.pop(printer_id)
+            rebuild_printer_indexes()
             save_data(PRINTERS_FILE, PRINTERS)
             flash(f"Printer {deleted_printer['name']} deleted successfully")
         else:
@@ -353,6 +358,7 @@ def delete_all_printers():
     global PRINTERS
     with WriteLock(printers_rwlock):
         PRINTERS.clear()
+        rebuild_printer_indexes()
         save_data(PRINTERS_FILE, PRINTERS)
     flash("All printers deleted successfully")
     return redirect(url_for('index'))
@@ -415,7 +421,7 @@ def send_print(printer_id):
                     orders_data = ORDERS.copy()
                 with ReadLock(printers_rwlock):
                     printers_copy = prepare_printer_data_for_broadcast(PRINTERS)
-                socketio.emit('status_update', {'printers': printers_copy, 'total_filament': total_filament, 'orders': orders_data})
+                emit_full_status(socketio, {'printers': printers_copy, 'total_filament': total_filament, 'orders': orders_data})
 
             return success
 
@@ -530,7 +536,7 @@ def stop_print(printer_id):
                     with ReadLock(printers_rwlock):
                         printers_data = prepare_printer_data_for_broadcast(PRINTERS)
 
-                    socketio.emit('status_update', {
+                    emit_full_status(socketio, {
                         'printers': printers_data,
                         'total_filament': total_filament,
                         'orders': orders_data
@@ -637,7 +643,7 @@ def pause_print(printer_id):
                     with ReadLock(printers_rwlock):
                         printers_data = prepare_printer_data_for_broadcast(PRINTERS)
 
-                    socketio.emit('status_update', {
+                    emit_full_status(socketio, {
                         'printers': printers_data,
                         'total_filament': total_filament,
                         'orders': orders_data
@@ -744,7 +750,7 @@ def resume_print(printer_id):
                     with ReadLock(printers_rwlock):
                         printers_data = prepare_printer_data_for_broadcast(PRINTERS)
 
-                    socketio.emit('status_update', {
+                    emit_full_status(socketio, {
                         'printers': printers_data,
                         'total_filament': total_filament,
                         'orders': orders_data
@@ -871,7 +877,7 @@ def stop_all_printers():
                 with ReadLock(printers_rwlock):
                     printers_data = prepare_printer_data_for_broadcast(PRINTERS)
 
-                socketio.emit('status_update', {
+                emit_full_status(socketio, {
                     'printers': printers_data,
                     'total_filament': total_filament,
                     'orders': orders_data
@@ -977,7 +983,7 @@ def mark_ready(printer_id):
                 orders_data = ORDERS.copy()
             with ReadLock(printers_rwlock):
                 printers_copy = prepare_printer_data_for_broadcast(PRINTERS)
-            socketio.emit('status_update', {'printers': printers_copy, 'total_filament': total_filament, 'orders': orders_data})
+            emit_full_status(socketio, {'printers': printers_copy, 'total_filament': total_filament, 'orders': orders_data})
 
         thread = threading.Thread(target=reset_printer_task)
         thread.daemon = True
@@ -1045,7 +1051,7 @@ def mark_ready_by_name():
         with ReadLock(printers_rwlock):
             printers_copy = prepare_printer_data_for_broadcast(PRINTERS)
 
-        socketio.emit('status_update', {
+        emit_full_status(socketio, {
             'printers': printers_copy,
             'total_filament': total_filament,
             'orders': orders_data
@@ -1120,7 +1126,7 @@ def mark_all_ready():
             with ReadLock(printers_rwlock):
                 printers_copy = prepare_printer_data_for_broadcast(PRINTERS)
 
-            socketio.emit('status_update', {
+            emit_full_status(socketio, {
                 'printers': printers_copy,
                 'total_filament': total_filament,
                 'orders': orders_data
@@ -1221,7 +1227,7 @@ def mark_group_ready(group):
                 orders_data = ORDERS.copy()
             with ReadLock(printers_rwlock):
                 printers_copy = prepare_printer_data_for_broadcast(PRINTERS)
-            socketio.emit('status_update', {'printers': printers_copy, 'total_filament': total_filament, 'orders': orders_data})
+            emit_full_status(socketio, {'printers': printers_copy, 'total_filament': total_filament, 'orders': orders_data})
 
         thread = threading.Thread(target=reset_group_printers_task)
         thread.daemon = True
@@ -1363,6 +1369,7 @@ def delete_printer_by_name():
         for i, printer in enumerate(PRINTERS):
             if printer['name'] == printer_name:
                 PRINTERS.pop(i)
+                rebuild_printer_indexes()
                 save_data(PRINTERS_FILE, PRINTERS)
                 flash(f"Printer {printer_name} deleted successfully")
                 return redirect(url_for('index'))
@@ -1421,7 +1428,7 @@ def clear_error(printer_id):
         with ReadLock(printers_rwlock):
             printers_copy = prepare_printer_data_for_broadcast(PRINTERS)
 
-        socketio.emit('status_update', {
+        emit_full_status(socketio, {
             'printers': printers_copy,
             'total_filament': total_filament,
             'orders': orders_data
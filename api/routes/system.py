@@ -2,8 +2,8 @@ from flask import render_template, request, redirect, url_for, flash, jsonify, m
 from services.state import (
     ReadLock, WriteLock, SafeLock, printers_rwlock, PRINTERS,
     orders_lock, ORDERS, filament_lock, TOTAL_FILAMENT_CONSUMPTION,
-    save_data, load_data, PRINTERS_FILE, ORDERS_FILE, TOTAL_FILAMENT_FILE,
-    sanitize_group_name
+    save_data, PRINTERS_FILE, ORDERS_FILE, TOTAL_FILAMENT_FILE,
+    sanitize_group_name, rebuild_printer_indexes, mark_orders_changed, get_total_filament_g
 )
 from services.default_settings import load_default_settings
 import os
@@ -43,9 +43,7 @@ def register_misc_routes(app, socketio):
 
         # Fallback to legacy template rendering
         # Get filament data
-        with SafeLock(filament_lock):
-            filament_data = load_data(TOTAL_FILAMENT_FILE, {"total_filament_used_g": 0})
-            total_filament_kg = filament_data.get("total_filament_used_g", 0) / 1000
+        total_filament_kg = get_total_filament_g() / 1000
 
         # Get active orders
         with SafeLock(orders_lock):
@@ -96,9 +94,7 @@ def register_misc_routes(app, socketio):
     @app.route("/stats")
     def stats():
         """Statistics page"""
-        with SafeLock(filament_lock):
-            filament_data = load_data(TOTAL_FILAMENT_FILE, {"total_filament_used_g": 0})
-            total_filament_kg = filament_data.get("total_filament_used_g", 0) / 1000
+        total_filament_kg = get_total_filament_g() / 1000
 
         with ReadLock(printers_rwlock):
             printer_stats = {
@@ -142,10 +138,12 @@ def register_misc_routes(app, socketio):
             # Clear in-memory data
             with WriteLock(printers_rwlock):
                 PRINTERS.clear()
+                rebuild_printer_indexes()
                 save_data(PRINTERS_FILE, PRINTERS)
 
             with SafeLock(orders_lock, 'clear_all_data'):
                 ORDERS.clear()
+                mark_orders_changed()
                 save_data(ORDERS_FILE, ORDERS)
 
             with SafeLock(filament_lock, 'clear_all_data'):
@@ -444,6 +442,7 @@ def register_misc_routes(app, socketio):
                     updated_count += 1
 
             if updated_count > 0:
+                rebuild_printer_indexes()
                 save_data(PRINTERS_FILE, PRINTERS)
                 flash(f"Updated {updated_count} printers from group '{group_name}' to '{new_group}'")
             else:
@@ -484,6 +483,7 @@ def register_misc_routes(app, socketio):
                     break
 
             if updated:
+                rebuild_printer_indexes()
                 save_data(PRINTERS_FILE, PRINTERS)
                 flash("Printer updated successfully")
             else:
@@ -618,6 +618,7 @@ def register_misc_routes(app, socketio):
                         }
 
                         ORDERS.append(order)
+                        mark_orders_changed()
                         successful_orders.append({
                             'row': job.get('source_row', job_index + 1),
                             'order_id': order_id,
@@ -740,6 +741,7 @@ def create_bulk_print_job(job_data):
                 }
 
             ORDERS.append(new_order)
+            mark_orders_changed()
             save_data(ORDERS_FILE, ORDERS)
 
             return True
@@ -132,6 +132,8 @@ BAMBU_ERROR_CODES = {
 # Store printer states (since MQTT is async)
 BAMBU_PRINTER_STATES = {}
 bambu_states_lock = threading.Lock()
+# Names whose state changed since the poller last synced them; guarded by bambu_states_lock
+BAMBU_DIRTY = set()
 
 # Store sequence IDs for commands
 SEQUENCE_IDS = {}
@@ -213,6 +215,7 @@ def on_connect(client, userdata, flags, rc):
             BAMBU_PRINTER_STATES[printer_name]['connected'] = False
             BAMBU_PRINTER_STATES[printer_name]['state'] = 'OFFLINE'
             BAMBU_PRINTER_STATES[printer_name]['last_error'] = error_msg
+            BAMBU_DIRTY.add(printer_name)
 
 def on_disconnect(client, userdata, rc):
     """MQTT disconnection callback"""
@@ -231,6 +234,7 @@ def on_disconnect(client, userdata, rc):
                 previous_state = BAMBU_PRINTER_STATES[printer_name].get('state', 'UNKNOWN')
                 BAMBU_PRINTER_STATES[printer_name]['state'] = 'OFFLINE'
                 BAMBU_PRINTER_STATES[printer_name]['disconnect_reason'] = f"Connection lost (rc={rc})"
+                BAMBU_DIRTY.add(printer_name)
                 logging.warning(f"Bambu printer {printer_name} state changed from {previous_state} to OFFLINE due to disconnect")
             # Calculate connection duration
             if 'connection_time' in BAMBU_PRINTER_STATES[printer_name]:
@@ -273,6 +277,7 @@ def on_message(client, userdata, msg):
 
             # Update last seen time
             BAMBU_PRINTER_STATES[printer_name]['last_seen'] = time.time()
+            BAMBU_DIRTY.add(printer_name)
 
             # Process print data
             if "print" in data:
@@ -678,6 +683,7 @@ def get_bambu_status(printer: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[
                 if printer_name in BAMBU_PRINTER_STATES:
                     BAMBU_PRINTER_STATES[printer_name]['state'] = 'OFFLINE'
                     BAMBU_PRINTER_STATES[printer_name]['connected'] = False
+                    BAMBU_DIRTY.add(printer_name)
             return printer, {
                 "printer": {
                     "state": "OFFLINE",
@@ -713,6 +719,7 @@ def get_bambu_status(printer: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[
         logging.warning(f"Bambu printer {printer_name} data is stale ({time_since_seen:.0f}s) and not connected, marking OFFLINE")
         with bambu_states_lock:
             BAMBU_PRINTER_STATES[printer_name]['state'] = 'OFFLINE'
+            BAMBU_DIRTY.add(printer_name)
         state_data['state'] = 'OFFLINE'
 
     # CRITICAL FIX: Also check the connected flag - if disconnected, state should be OFFLINE
@@ -771,6 +778,7 @@ def clear_bambu_error(printer: Dict[str, Any]) -> bool:
             BAMBU_PRINTER_STATES[printer_name]['state'] = 'READY'
             BAMBU_PRINTER_STATES[printer_name]['error'] = None
             BAMBU_PRINTER_STATES[printer_name]['hms_alerts'] = []
+            BAMBU_DIRTY.add(printer_name)
             logging.info(f"Cleared error state for Bambu printer {printer_name}")
             return True
 
@@ -843,6 +851,7 @@ def send_bambu_print_command(printer: Dict[str, Any], filename: str, filepath: s
                     BAMBU_PRINTER_STATES[printer_name]['state'] = 'OFFLINE'
                     BAMBU_PRINTER_STATES[printer_name]['connected'] = False
                     BAMBU_PRINTER_STATES[printer_name]['disconnect_reason'] = 'Failed to connect for print command'
+                    BAMBU_DIRTY.add(printer_name)
             return False
 
     client = MQTT_CLIENTS[printer_name]
@@ -918,6 +927,7 @@ def send_bambu_gcode_command(printer: Dict[str, Any], gcode: str, force_reconnec
                     BAMBU_PRINTER_STATES[printer_name]['state'] = 'OFFLINE'
                     BAMBU_PRINTER_STATES[printer_name]['connected'] = False
                     BAMBU_PRINTER_STATES[printer_name]['disconnect_reason'] = 'Failed to connect for G-code command'
+                    BAMBU_DIRTY.add(printer_name)
             return False
         # Wait for connection to stabilize
         time.sleep(2)
@@ -932,6 +942,7 @@ def send_bambu_gcode_command(printer: Dict[str, Any], gcode: str, force_reconnec
                 BAMBU_PRINTER_STATES[printer_name]['state'] = 'OFFLINE'
                 BAMBU_PRINTER_STATES[printer_name]['connected'] = False
                 BAMBU_PRINTER_STATES[printer_name]['disconnect_reason'] = 'MQTT client not connected'
+                BAMBU_DIRTY.add(printer_name)
         return False
 
     logging.info(f"[GCODE_TEST] MQTT connection confirmed for {printer_name}")
@@ -1051,6 +1062,7 @@ def send_bambu_ejection_gcode(printer: Dict[str, Any], end_gcode: str, force: bo
                 BAMBU_PRINTER_STATES[printer_name]['state'] = 'OFFLINE'
                 BAMBU_PRINTER_STATES[printer_name]['connected'] = False
                 BAMBU_PRINTER_STATES[printer_name]['disconnect_reason'] = 'Not connected for ejection G-code'
+                BAMBU_DIRTY.add(printer_name)
         return False
 
     client = MQTT_CLIENTS[printer_name]
@@ -1080,6 +1092,7 @@ def send_bambu_ejection_gcode(printer: Dict[str, Any], end_gcode: str, force: bo
             if printer_name in BAMBU_PRINTER_STATES:
                 BAMBU_PRINTER_STATES[printer_name]['state'] = 'EJECTING'
                 BAMBU_PRINTER_STATES[printer_name]['ejection_complete'] = False
+                BAMBU_DIRTY.add(printer_name)
                 BAMBU_PRINTER_STATES[printer_name]['ejection_start_time'] = time.time()
                 # Mark that we're waiting for M400 completion
                 BAMBU_PRINTER_STATES[printer_name]['waiting_for_m400'] = True
@@ -1252,7 +1265,7 @@ def maintain_bambu_connections():
             logging.error(f"Error in maintain_bambu_connections: {str(e)}")
 
 # Start the connection maintenance thread
-threading.Thread(target=maintain_bambu_connections, daemon=True).start()
+threading.Thread(target=maintain_bambu_connections, daemon=True, name="BambuConnectionMaintainer").start()
 
 def disconnect_all_bambu_printers():
     """Disconnect all Bambu printers - call during shutdown"""
@@ -12,7 +12,7 @@ from services.state import (
     logging, orders_lock, printers_rwlock,
     SafeLock, ReadLock, WriteLock,
     get_ejection_paused, set_printer_ejection_state,
-    get_printer_ejection_state, clear_printer_ejection_state
+    get_printer_ejection_state, clear_printer_ejection_state, get_order_by_id
 )
 from services.bambu_handler import (
     send_bambu_ejection_gcode, BAMBU_PRINTER_STATES, bambu_states_lock
@@ -169,7 +169,7 @@ def handle_finished_state_ejection(printer, printer_name, current_file, current_
 
     # Check if we have an order with ejection enabled
     with SafeLock(orders_lock):
-        order = next((o for o in ORDERS if o['id'] == current_order_id), None)
+        order = get_order_by_id(current_order_id)
         if order:
             debug_log('cooldown', f"Found order {current_order_id}: ejection={order.get('ejection_enabled')}, cooldown={order.get('cooldown_temp')}, file={order.get('filename')}")
         else:
@@ -320,6 +320,9 @@ async def async_send_ejection_gcode(session, printer, headers, ejection_url, gco
 
     logging.debug(f"EJECTION: Starting actual file transfer for {printer_name}")
 
+    # Encode the upload body once rather than on every retry attempt
+    upload_body = gcode_content.encode('utf-8') if isinstance(gcode_content, str) else gcode_content
+
     async def _send_gcode():
         if printer.get('type') == 'bambu':
             # For Bambu printers, send G-code directly via MQTT
@@ -368,7 +371,7 @@ async def async_send_ejection_gcode(session, printer, headers, ejection_url, gco
             try:
                 async with session.put(
                     ejection_url,
-                    data=gcode_content.encode('utf-8'),
+                    data=upload_body,
                     headers={**headers, "Print-After-Upload": "?1"}
                 ) as upload_resp:
                     logging.debug(f"EJECTION: Upload response for {printer_name}: HTTP {upload_resp.status}")
@@ -501,15 +504,12 @@ def enhanced_prusa_ejection_monitoring():
                                 save_data(PRINTERS_FILE, PRINTERS)
 
                                 # Trigger job distribution after a short delay
-                                def trigger_distribution():
-                                    try:
-                                        from services.order_distributor import start_background_distribution
-                                        from app import socketio, app
-                                        start_background_distribution(socketio, app)
-                                    except Exception as e:
-                                        logging.error(f"Error triggering distribution after ejection: {e}")
-
-                                threading.Timer(2.0, trigger_distribution).start()
+                                try:
+                                    from services.order_distributor import schedule_background_distribution
+                                    from app import socketio, app
+                                    schedule_background_distribution(socketio, app)
+                                except Exception as e:
+                                    logging.error(f"Error triggering distribution after ejection: {e}")
 
             else:
                 logging.warning(f"Failed to check ejection status for {printer_info['name']}: HTTP {response.status_code}")
@@ -537,7 +537,7 @@ def start_prusa_ejection_monitor():
 def trigger_mass_ejection_for_finished_printers(socketio, app):
     """Trigger ejection for all FINISHED printers that have ejection enabled"""
     # Import here to avoid circular imports
-    from services.order_distributor import start_background_distribution
+    from services.order_distributor import schedule_background_distribution
 
     if get_ejection_paused():
         logging.warning("Mass ejection requested but ejection is still paused - aborting")
@@ -555,7 +555,7 @@ def trigger_mass_ejection_for_finished_printers(socketio, app):
                 order_id = printer.get('order_id')
                 if order_id:
                     with SafeLock(orders_lock):
-                        order = next((o for o in ORDERS if o['id'] == order_id), None)
+                        order = get_order_by_id(order_id)
                         if order and order.get('ejection_enabled', False):
                             ejection_state = get_printer_ejection_state(printer['name'])
                             if ejection_state['state'] not in ['in_progress', 'completed']:
@@ -589,7 +589,7 @@ def trigger_mass_ejection_for_finished_printers(socketio, app):
         save_data(PRINTERS_FILE, PRINTERS)
 
     # Trigger status update to process the queued ejections
-    threading.Timer(1.0, lambda: start_background_distribution(socketio, app)).start()
+    schedule_background_distribution(socketio, app, delay=1.0)
 
     logging.info(f"=== MASS EJECTION: {ejection_count} printers queued ===")
     return ejection_count
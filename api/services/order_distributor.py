@@ -2,6 +2,7 @@
 Order distribution logic - handles assigning orders to available printers.
 """
 import re
+import time
 import uuid
 import asyncio
 import aiohttp
@@ -9,18 +10,26 @@ import threading
 from datetime import datetime
 
 from services.state import (
-    PRINTERS_FILE, TOTAL_FILAMENT_FILE, PRINTERS, ORDERS, save_data, load_data, decrypt_api_key,
+    PRINTERS_FILE, PRINTERS, ORDERS, save_data, decrypt_api_key,
     logging, orders_lock, filament_lock, printers_rwlock,
-    SafeLock, ReadLock, WriteLock
+    SafeLock, ReadLock, WriteLock, get_total_filament_g
 )
 from services.print_jobs import check_and_start_print
-from services.status_poller import prepare_printer_data_for_broadcast
+from services.status_poller import prepare_printer_data_for_broadcast, emit_full_status
 from utils.config import Config
 from utils.logger import log_distribution_event, log_job_lifecycle
 
 # Semaphore to prevent concurrent distribution runs
 distribution_semaphore = threading.Semaphore(1)
 
+# Debounced distribution requests: one long-lived thread fires at the earliest
+# pending deadline instead of a threading.Timer per request
+_dist_lock = threading.Lock()
+_dist_event = threading.Event()
+_dist_deadline = None
+_dist_args = None
+_dist_thread = None
+
 
 def start_background_distribution(socketio, app, batch_size=10):
     """Start order distribution in a background thread"""
@@ -51,22 +60,58 @@ def start_background_distribution(socketio, app, batch_size=10):
             logging.debug(f"Releasing distribution semaphore for {task_id}")
             distribution_semaphore.release()
 
-    thread = threading.Thread(target=run_with_semaphore)
+    thread = threading.Thread(target=run_with_semaphore, name=f"OrderDistribution-{task_id[:8]}")
     thread.daemon = True
     thread.start()
     return task_id
 
 
+def schedule_background_distribution(socketio, app, delay=2.0):
+    """Request a distribution run after *delay* seconds.
+
+    Requests made before the pending run fires are coalesced into it, so a burst
+    of state transitions triggers a single distribution.
+    """
+    global _dist_deadline, _dist_args, _dist_thread
+    with _dist_lock:
+        deadline = time.monotonic() + delay
+        if _dist_deadline is None or deadline < _dist_deadline:
+            _dist_deadline = deadline
+        _dist_args = (socketio, app)
+        if _dist_thread is None or not _dist_thread.is_alive():
+            _dist_thread = threading.Thread(target=_distribution_scheduler_loop, name="DistributionScheduler")
+            _dist_thread.daemon = True
+            _dist_thread.start()
+    _dist_event.set()
+
+
+def _distribution_scheduler_loop():
+    """Sleep until the pending deadline, then start one background distribution."""
+    global _dist_deadline
+    while True:
+        with _dist_lock:
+            deadline = _dist_deadline
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        _dist_event.wait(timeout)
+        _dist_event.clear()
+
+        with _dist_lock:
+            if _dist_deadline is None or time.monotonic() < _dist_deadline:
+                continue
+            _dist_deadline = None
+            socketio, app = _dist_args
+
+        try:
+            start_background_distribution(socketio, app)
+        except Exception as e:
+            logging.error(f"Error in scheduled distribution: {str(e)}")
+
+
 def run_background_distribution(socketio, app, task_id, batch_size=10):
     """Run the async distribution in a synchronous context"""
     try:
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        loop.run_until_complete(distribute_orders_async(socketio, app, task_id, batch_size))
+        # Each run gets its own short-lived thread, so use a loop that is closed afterwards
+        asyncio.run(distribute_orders_async(socketio, app, task_id, batch_size))
     except Exception as e:
         logging.error(f"Error in background distribution: {str(e)}")
 
@@ -92,8 +137,7 @@ async def distribute_orders_async(socketio, app, task_id=None, batch_size=10):
 
     current_filament = 0
     with SafeLock(filament_lock):
-        filament_data = load_data(TOTAL_FILAMENT_FILE, {"total_filament_used_g": 0})
-        current_filament = filament_data.get("total_filament_used_g", 0)
+        current_filament = get_total_filament_g()
         TOTAL_FILAMENT_CONSUMPTION = current_filament
         logging.debug(f"Starting distribution - total filament: {TOTAL_FILAMENT_CONSUMPTION}g")
 
@@ -279,7 +323,7 @@ async def distribute_orders_async(socketio, app, task_id=None, batch_size=10):
 
     logging.debug(f"Final summary: {total_processed} jobs processed, {total_successful} successful, {total_processed - total_successful} failed")
 
-    socketio.emit('status_update', {
+    emit_full_status(socketio, {
         'printers': printers_copy,
         'total_filament': total_filament,
         'orders': orders_data
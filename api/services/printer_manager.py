@@ -11,12 +11,10 @@ from the following submodules:
 """
 import time
 import threading
-import asyncio
 
 from services.state import (
-    PRINTERS, ORDERS, TOTAL_FILAMENT_CONSUMPTION,
-    logging, orders_lock, filament_lock, printers_rwlock,
-    SafeLock, ReadLock, reconcile_order_counts
+    PRINTERS, logging, printers_rwlock,
+    ReadLock, reconcile_order_counts, snapshot_broadcast_state
 )
 from utils.config import Config
 
@@ -28,13 +26,12 @@ from services.printer_utils import (
     convert_mm_to_g,
     extract_filament_from_file,
     get_event_loop_for_thread,
-    get_connection_pool,
     get_session,
+    get_shared_session,
     close_connection_pool,
     emergency_fix_stuck_printers,
     mark_group_ready,
     thread_local,
-    CONNECTION_POOL,
 )
 
 # Re-export from ejection_manager
@@ -76,8 +73,10 @@ from services.status_poller import (
     state_map,
     get_minutes_since_finished,
     prepare_printer_data_for_broadcast,
+    emit_full_status,
     update_bambu_printer_states,
     ensure_finish_times,
+    fetch_job,
     fetch_status,
     get_printer_status_async,
 )
@@ -86,6 +85,7 @@ from services.status_poller import (
 from services.order_distributor import (
     distribution_semaphore,
     start_background_distribution,
+    schedule_background_distribution,
     run_background_distribution,
     distribute_orders_async,
 )
@@ -118,7 +118,7 @@ def start_background_tasks(socketio, app):
             except Exception as e:
                 logging.error(f"Failed to connect Bambu printer {printer['name']}: {e}")
 
-    bambu_thread = threading.Thread(target=_connect_bambu_printers, daemon=True)
+    bambu_thread = threading.Thread(target=_connect_bambu_printers, daemon=True, name="BambuConnect")
     bambu_thread.start()
 
     def schedule_status_polling():
@@ -137,12 +137,8 @@ def start_background_tasks(socketio, app):
 
                 logging.debug(f"Processing batch {batch_index + 1}/{num_batches}")
 
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
+                # Reuse this thread's loop across polls instead of probing get_event_loop() each time
+                loop = get_event_loop_for_thread()
                 loop.run_until_complete(get_printer_status_async(socketio, app, batch_index, Config.STATUS_BATCH_SIZE))
 
                 batch_index = (batch_index + 1) % num_batches
@@ -152,7 +148,7 @@ def start_background_tasks(socketio, app):
                 logging.error(f"Error in status polling: {str(e)}")
                 time.sleep(Config.STATUS_REFRESH_INTERVAL)
 
-    status_thread = threading.Thread(target=schedule_status_polling)
+    status_thread = threading.Thread(target=schedule_status_polling, name="StatusPoller")
     status_thread.daemon = True
     status_thread.start()
 
@@ -167,28 +163,22 @@ def start_background_tasks(socketio, app):
                 if corrections > 0:
                     logging.info(f"Auto-reconciliation increased {corrections} order counts")
 
-                    with SafeLock(filament_lock):
-                        total_filament = TOTAL_FILAMENT_CONSUMPTION / 1000
-                    with SafeLock(orders_lock):
-                        orders_data = ORDERS.copy()
-                    with ReadLock(printers_rwlock):
-                        printers_copy = prepare_printer_data_for_broadcast(PRINTERS)
-
-                    socketio.emit('status_update', {
-                        'printers': printers_copy,
-                        'total_filament': total_filament,
+                    total_filament, orders_data, printers_snapshot = snapshot_broadcast_state()
+                    emit_full_status(socketio, {
+                        'printers': prepare_printer_data_for_broadcast(printers_snapshot),
+                        'total_filament': total_filament / 1000,
                         'orders': orders_data
                     })
             except Exception as e:
                 logging.error(f"Error in order reconciliation scheduler: {str(e)}")
                 time.sleep(300)
 
-    reconciliation_thread = threading.Thread(target=schedule_order_reconciliation)
+    reconciliation_thread = threading.Thread(target=schedule_order_reconciliation, name="OrderReconciliation")
     reconciliation_thread.daemon = True
     reconciliation_thread.start()
 
     # Add periodic deduplication check
-    dedup_thread = threading.Thread(target=lambda: periodic_deduplication_check(socketio, app))
+    dedup_thread = threading.Thread(target=periodic_deduplication_check, args=(socketio, app), name="Deduplication")
     dedup_thread.daemon = True
     dedup_thread.start()
 
@@ -204,13 +194,12 @@ __all__ = [
     'convert_mm_to_g',
     'extract_filament_from_file',
     'get_event_loop_for_thread',
-    'get_connection_pool',
     'get_session',
+    'get_shared_session',
     'close_connection_pool',
     'emergency_fix_stuck_printers',
     'mark_group_ready',
     'thread_local',
-    'CONNECTION_POOL',
     # ejection_manager
     'EJECTION_LOCKS',
     'ejection_locks_lock',
@@ -243,13 +232,16 @@ __all__ = [
     'state_map',
     'get_minutes_since_finished',
     'prepare_printer_data_for_broadcast',
+    'emit_full_status',
     'update_bambu_printer_states',
     'ensure_finish_times',
+    'fetch_job',
     'fetch_status',
     'get_printer_status_async',
     # order_distributor
     'distribution_semaphore',
     'start_background_distribution',
+    'schedule_background_distribution',
     'run_background_distribution',
     'distribute_orders_async',
     # Main function
@@ -4,6 +4,7 @@ and emergency recovery operations.
 """
 import os
 import re
+import math
 import time
 import asyncio
 import aiohttp
@@ -12,8 +13,9 @@ from contextlib import asynccontextmanager
 
 from services.state import (
     PRINTERS_FILE, ORDERS_FILE,
-    PRINTERS, ORDERS,
-    save_data, logging, orders_lock, filament_lock, printers_rwlock,
+    PRINTERS, ORDERS, PRINTERS_BY_GROUP, rebuild_printer_indexes, mark_orders_changed,
+    get_structure_versions,
+    queue_save, logging, orders_lock, filament_lock, printers_rwlock,
     SafeLock, ReadLock, WriteLock,
     TOTAL_FILAMENT_CONSUMPTION
 )
@@ -22,8 +24,12 @@ from utils.config import Config
 # Thread-local storage for event loops
 thread_local = threading.local()
 
-# Global connection pool (deprecated - use get_session instead)
-CONNECTION_POOL = None
+# Long-lived aiohttp session reused across status polls (see get_shared_session)
+_SHARED_SESSION = None
+_SHARED_SESSION_LOOP = None
+
+# Constant part of convert_mm_to_g for 1.75mm filament
+_MM_TO_CM3 = math.pi * (1.75 / 2) ** 2 / 10_000
 
 
 def deduplicate_printers():
@@ -47,7 +53,8 @@ def deduplicate_printers():
         if duplicates_removed > 0:
             PRINTERS.clear()
             PRINTERS.extend(unique_printers)
-            save_data(PRINTERS_FILE, PRINTERS)
+            rebuild_printer_indexes()
+            queue_save(PRINTERS_FILE, PRINTERS)
             logging.warning(f"DEDUPLICATION: Removed {duplicates_removed} duplicate printers. Now have {len(PRINTERS)} unique printers")
         else:
             logging.debug(f"DEDUPLICATION: No duplicates found. Have {len(PRINTERS)} unique printers")
@@ -74,33 +81,51 @@ def deduplicate_orders():
         if duplicates_removed > 0:
             ORDERS.clear()
             ORDERS.extend(unique_orders)
-            save_data(ORDERS_FILE, ORDERS)
+            mark_orders_changed()
+            queue_save(ORDERS_FILE, ORDERS)
             logging.warning(f"DEDUPLICATION: Removed {duplicates_removed} duplicate orders. Now have {len(ORDERS)} unique orders")
         else:
             logging.debug(f"DEDUPLICATION: No duplicates found. Have {len(ORDERS)} unique orders")
 
 
+def _has_duplicates(items, key):
+    """Return True as soon as two items share the same key (or one has none)"""
+    seen = set()
+    for item in items:
+        value = item.get(key)
+        if not value or value in seen:
+            return True
+        seen.add(value)
+    return False
+
+
 def periodic_deduplication_check(socketio, app):
     """Periodically check for and remove duplicates"""
+    last_printers_version = last_orders_version = None
     while True:
         try:
             time.sleep(300)  # Check every 5 minutes
 
-            # Check for printer duplicates
-            with ReadLock(printers_rwlock):
-                printer_names = [p.get('name') for p in PRINTERS]
-                if len(printer_names) != len(set(printer_names)):
-                    logging.warning("DUPLICATE PRINTERS DETECTED! Running deduplication...")
+            # Duplicates can only appear when printers/orders are added or renamed
+            printers_version, orders_version = get_structure_versions()
 
-            deduplicate_printers()
+            # Check for printer duplicates; only take the write lock if there are any
+            if printers_version != last_printers_version:
+                with ReadLock(printers_rwlock):
+                    printers_dirty = _has_duplicates(PRINTERS, 'name')
+                if printers_dirty:
+                    logging.warning("DUPLICATE PRINTERS DETECTED! Running deduplication...")
+                    deduplicate_printers()
+                last_printers_version = printers_version
 
             # Check for order duplicates
-            with SafeLock(orders_lock):
-                order_ids = [o.get('id') for o in ORDERS]
-                if len(order_ids) != len(set(order_ids)):
+            if orders_version != last_orders_version:
+                with SafeLock(orders_lock):
+                    orders_dirty = _has_duplicates(ORDERS, 'id')
+                if orders_dirty:
                     logging.warning("DUPLICATE ORDERS DETECTED! Running deduplication...")
-
-            deduplicate_orders()
+                    deduplicate_orders()
+                last_orders_version = orders_version
 
         except Exception as e:
             logging.error(f"Error in periodic deduplication: {e}")
@@ -108,9 +133,7 @@ def periodic_deduplication_check(socketio, app):
 
 def convert_mm_to_g(filament_mm, density):
     """Convert filament length in mm to weight in grams"""
-    filament_radius = 1.75 / 2
-    volume_cm3 = (3.14159 * (filament_radius ** 2) * (filament_mm / 10)) / 1000
-    return volume_cm3 * density
+    return filament_mm * _MM_TO_CM3 * density
 
 
 def extract_filament_from_file(filepath, is_bgcode=False):
@@ -183,19 +206,6 @@ def get_event_loop_for_thread():
     return thread_local.loop
 
 
-def get_connection_pool():
-    """Get the global connection pool (deprecated - use get_session instead)"""
-    global CONNECTION_POOL
-    logging.warning("Direct pool access is deprecated, use async context manager instead")
-    if CONNECTION_POOL is None or CONNECTION_POOL.closed:
-        logging.debug("Creating new aiohttp ClientSession")
-        CONNECTION_POOL = aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
-            timeout=aiohttp.ClientTimeout(total=Config.API_TIMEOUT)
-        )
-    return CONNECTION_POOL
-
-
 @asynccontextmanager
 async def get_session():
     """Async context manager for aiohttp sessions"""
@@ -210,16 +220,39 @@ async def get_session():
             await session.close()
 
 
+def get_shared_session():
+    """Return the long-lived ClientSession for the running loop, creating it if needed.
+
+    Keeping one session open lets repeat polls reuse keep-alive connections to
+    each printer. A session is tied to the loop that created it, so a new one is
+    made if the caller is on a different loop. Per-host connections are capped
+    and connecting has its own short timeout, so a dead printer fails fast
+    instead of holding a poll open for the full API timeout.
+    """
+    global _SHARED_SESSION, _SHARED_SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SHARED_SESSION is None or _SHARED_SESSION.closed or _SHARED_SESSION_LOOP is not loop:
+        logging.debug("Creating shared aiohttp ClientSession")
+        _SHARED_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, limit_per_host=2, ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=Config.API_TIMEOUT, connect=Config.API_CONNECT_TIMEOUT,
+                                          sock_read=Config.API_TIMEOUT)
+        )
+        _SHARED_SESSION_LOOP = loop
+    return _SHARED_SESSION
+
+
 async def close_connection_pool():
-    """Close the global connection pool and cleanup resources"""
-    global CONNECTION_POOL
-    if CONNECTION_POOL is not None and not CONNECTION_POOL.closed:
+    """Release printer connections on shutdown"""
+    global _SHARED_SESSION, _SHARED_SESSION_LOOP
+    if _SHARED_SESSION is not None and not _SHARED_SESSION.closed:
         try:
-            await CONNECTION_POOL.close()
-            CONNECTION_POOL = None
-            logging.debug("Successfully closed aiohttp connection pool")
+            await _SHARED_SESSION.close()
+            logging.debug("Closed shared aiohttp session")
         except Exception as e:
-            logging.error(f"Error closing connection pool: {e}")
+            logging.error(f"Error closing shared aiohttp session: {e}")
+    _SHARED_SESSION = None
+    _SHARED_SESSION_LOOP = None
 
     # Clean up Bambu MQTT connections
     from services.state import cleanup_mqtt_connections
@@ -228,9 +261,15 @@ async def close_connection_pool():
 
 def emergency_fix_stuck_printers():
     """Emergency function to fix stuck printers"""
+    # Find candidates under the read lock so the write lock only covers the updates
+    with ReadLock(printers_rwlock):
+        stuck = [p for p in PRINTERS if p.get('state') == 'FINISHED']
+    if not stuck:
+        return 0
+
     with WriteLock(printers_rwlock):
         fixed_count = 0
-        for printer in PRINTERS:
+        for printer in stuck:
             if printer.get('state') == 'FINISHED':
                 # Force all FINISHED printers to READY
                 printer.update({
@@ -251,7 +290,7 @@ def emergency_fix_stuck_printers():
                 logging.warning(f"EMERGENCY: Fixed stuck printer {printer['name']}")
 
         if fixed_count > 0:
-            save_data(PRINTERS_FILE, PRINTERS)
+            queue_save(PRINTERS_FILE, PRINTERS)
             logging.warning(f"EMERGENCY: Fixed {fixed_count} stuck printers")
 
     return fixed_count
@@ -260,12 +299,12 @@ def emergency_fix_stuck_printers():
 def mark_group_ready(group_name, socketio=None):
     """Mark all FINISHED printers in a specific group as READY"""
     # Import here to avoid circular imports
-    from services.status_poller import prepare_printer_data_for_broadcast
+    from services.status_poller import prepare_printer_data_for_broadcast, emit_full_status
 
     with WriteLock(printers_rwlock):
         count = 0
-        for printer in PRINTERS:
-            if str(printer.get('group', 'Default')) == str(group_name) and printer['state'] == 'FINISHED':
+        for printer in PRINTERS_BY_GROUP.get(str(group_name), ()):
+            if printer['state'] == 'FINISHED':
                 printer.update({
                     "state": 'READY',
                     "status": 'Ready',
@@ -284,9 +323,8 @@ def mark_group_ready(group_name, socketio=None):
                 count += 1
                 logging.info(f"Marked {printer['name']} in group {group_name} as READY")
 
-        save_data(PRINTERS_FILE, PRINTERS)
-
         if count > 0:
+            queue_save(PRINTERS_FILE, PRINTERS)
             logging.info(f"Marked {count} printers in group {group_name} as READY")
 
             # Emit status update if socketio is available
@@ -297,7 +335,7 @@ def mark_group_ready(group_name, socketio=None):
                     orders_data = ORDERS.copy()
                 printers_copy = prepare_printer_data_for_broadcast(PRINTERS)
 
-                socketio.emit('status_update', {
+                emit_full_status(socketio, {
                     'printers': printers_copy,
                     'total_filament': total_filament,
                     'orders': orders_data
@@ -1,5 +1,7 @@
 from datetime import datetime
 import importlib.util
+import functools
+import itertools
 import json
 import os
 import threading
@@ -12,6 +14,11 @@ import uuid
 import re
 from flask import current_app
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # Set up logging directory
 # Support DATA_DIR environment variable for test isolation
 LOG_DIR = os.path.join(os.getenv('DATA_DIR', os.path.expanduser("~")), "PrintQueData")
@@ -31,6 +38,11 @@ EJECTION_CODES_FILE = os.path.join(LOG_DIR, "ejection_codes.json")
 
 # Global state variables
 PRINTERS = []
+PRINTERS_BY_NAME = {}  # printer name -> index into PRINTERS
+PRINTERS_BY_GROUP = {}  # str(group) -> list of printer dicts
+PRINTERS_VERSION = 0  # Bumped whenever printers are added, removed, renamed or regrouped
+ORDERS_VERSION = 0  # Bumped whenever orders are added or removed
+ORDERS_BY_ID = {}  # order id -> order dict
 TOTAL_FILAMENT_CONSUMPTION = 0
 ORDERS = []
 EJECTION_CODES = []  # List of stored ejection code presets
@@ -396,6 +408,12 @@ def get_printer_ejection_state(printer_name):
     with EJECTION_STATES_LOCK:
         return EJECTION_STATES.get(printer_name, {'state': 'none', 'timestamp': 0, 'metadata': {}})
 
+def get_printer_ejection_states(printer_names):
+    """Get ejection states for several printers, taking the lock once"""
+    with EJECTION_STATES_LOCK:
+        return {name: EJECTION_STATES.get(name, {'state': 'none', 'timestamp': 0, 'metadata': {}})
+                for name in printer_names}
+
 def clear_printer_ejection_state(printer_name):
     """Clear ejection state for a specific printer"""
     with EJECTION_STATES_LOCK:
@@ -496,15 +514,84 @@ def cleanup_ejection_locks():
                     del EJECTION_LOCKS[printer_name]
                     logging.debug(f"Cleaned up ejection lock for removed printer: {printer_name}")
 
+def rebuild_printer_indexes():
+    """Rebuild PRINTERS_BY_NAME / PRINTERS_BY_GROUP.
+
+    Call with printers_rwlock write-held after adding, removing, reordering,
+    renaming or regrouping printers.
+    """
+    global PRINTERS_VERSION
+    by_name = {}
+    by_group = {}
+    for i, printer in enumerate(PRINTERS):
+        by_name.setdefault(printer.get('name'), i)
+        by_group.setdefault(str(printer.get('group', 'Default')), []).append(printer)
+    PRINTERS_BY_NAME.clear()
+    PRINTERS_BY_NAME.update(by_name)
+    PRINTERS_BY_GROUP.clear()
+    PRINTERS_BY_GROUP.update(by_group)
+    PRINTERS_VERSION += 1
+
+def mark_orders_changed():
+    """Record that orders were added or removed and rebuild ORDERS_BY_ID. Call with orders_lock held."""
+    global ORDERS_VERSION
+    by_id = {}
+    for order in ORDERS:
+        by_id.setdefault(order.get('id'), order)
+    ORDERS_BY_ID.clear()
+    ORDERS_BY_ID.update(by_id)
+    ORDERS_VERSION += 1
+
+def get_order_by_id(order_id):
+    """Return the order with this id, or None. Caller must hold orders_lock."""
+    order = ORDERS_BY_ID.get(order_id)
+    if order is not None and order.get('id') == order_id:
+        return order
+    # Not indexed (list changed without mark_orders_changed) - fall back to a scan
+    return next((o for o in ORDERS if o.get('id') == order_id), None)
+
+def get_structure_versions():
+    """Return (PRINTERS_VERSION, ORDERS_VERSION)"""
+    return PRINTERS_VERSION, ORDERS_VERSION
+
+def get_printer_index(printer_name):
+    """Return the PRINTERS index for a name, or None. Caller must hold printers_rwlock."""
+    idx = PRINTERS_BY_NAME.get(printer_name)
+    if idx is not None and idx < len(PRINTERS) and PRINTERS[idx].get('name') == printer_name:
+        return idx
+    # Index is stale (list changed without a rebuild) - fall back to a scan
+    for i, printer in enumerate(PRINTERS):
+        if printer.get('name') == printer_name:
+            return i
+    return None
+
+def snapshot_broadcast_state():
+    """Copy the filament total, ORDERS and PRINTERS for a status broadcast.
+
+    The filament total is read from TOTAL_FILAMENT_FILE via get_total_filament_g(),
+    since the running totals live in the modules that update them. ORDERS and
+    PRINTERS are copied together in LOCK_ACQUISITION_ORDER; printer dicts are
+    shallow-copied so the caller can prepare them after the locks are released.
+    Returns (total_filament_g, orders, printers).
+    """
+    total_filament_g = get_total_filament_g()
+    with SafeLock(orders_lock), ReadLock(printers_rwlock):
+        return total_filament_g, ORDERS.copy(), [p.copy() for p in PRINTERS]
+
 def encrypt_api_key(api_key):
     return cipher.encrypt(api_key.encode()).decode()
 
+@functools.lru_cache(maxsize=256)
+def _decrypt_cached(encrypted_api_key):
+    # Keyed by ciphertext, so an edited key is simply a new entry; failures raise and aren't cached
+    return cipher.decrypt(encrypted_api_key.encode()).decode()
+
 def decrypt_api_key(encrypted_api_key):
     try:
         if not encrypted_api_key:
             logger.warning("Empty API key provided for decryption")
             return None
-        return cipher.decrypt(encrypted_api_key.encode()).decode()
+        return _decrypt_cached(encrypted_api_key)
     except Exception as e:
         logger.error(
             "Decryption failed for API key: %s. "
@@ -513,21 +600,96 @@ def decrypt_api_key(encrypted_api_key):
         )
         return None
 
+def _encode_json(data):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Types orjson rejects (e.g. ints over 64 bits) go through the stdlib encoder
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# JSON parser for data files and printer API responses; orjson when it is installed
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Background persistence: queue_save() encodes under the caller's lock and the
+# PersistenceWriter thread does the disk write. Pending writes to the same file
+# coalesce, and sequence numbers keep an older snapshot from overwriting a newer one.
+_save_seq = itertools.count()
+_pending_saves = {}  # filename -> (seq, payload)
+_written_seq = {}  # filename -> seq of the last payload written
+_pending_saves_cond = threading.Condition()
+_file_write_lock = threading.Lock()
+
+def _write_payload(filename, seq, payload):
+    with _file_write_lock:
+        if _written_seq.get(filename, -1) > seq:
+            return  # A newer snapshot is already on disk
+        # Write to a temp file and swap it in so a crash never leaves a truncated file
+        tmp_path = f"{filename}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filename)
+        _written_seq[filename] = seq
+
 def save_data(filename, data):
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        payload = _encode_json(data)
+        with _pending_saves_cond:
+            seq = next(_save_seq)
+            _pending_saves.pop(filename, None)  # Superseded by this write
+        _write_payload(filename, seq, payload)
         logger.debug(f"Saved data to {filename}")
     except Exception as e:
         logger.error(f"Failed to save data to {filename}: {str(e)}")
 
+def queue_save(filename, data):
+    """Encode data now and write it to disk on the persistence thread.
+
+    data is fully encoded before this returns, so call it while holding the
+    lock that guards data (e.g. WriteLock(printers_rwlock) for PRINTERS); the
+    queued bytes then match the state the caller just published.
+    """
+    try:
+        payload = _encode_json(data)
+    except Exception as e:
+        logger.error(f"Failed to encode data for {filename}: {str(e)}")
+        return
+    with _pending_saves_cond:
+        _pending_saves[filename] = (next(_save_seq), payload)
+        _pending_saves_cond.notify()
+
+def flush_pending_saves():
+    """Write any queued snapshots synchronously (used on shutdown)"""
+    with _pending_saves_cond:
+        pending = list(_pending_saves.items())
+        _pending_saves.clear()
+    for filename, (seq, payload) in pending:
+        try:
+            _write_payload(filename, seq, payload)
+        except Exception as e:
+            logger.error(f"Failed to save data to {filename}: {str(e)}")
+
+def persistence_writer():
+    while True:
+        with _pending_saves_cond:
+            while not _pending_saves:
+                _pending_saves_cond.wait()
+            filename = next(iter(_pending_saves))
+            seq, payload = _pending_saves.pop(filename)
+        try:
+            _write_payload(filename, seq, payload)
+            logger.debug(f"Saved data to {filename}")
+        except Exception as e:
+            logger.error(f"Failed to save data to {filename}: {str(e)}")
+
 def load_data(filename, default_value):
     bundle_path = os.path.join(os.path.dirname(__file__), os.path.basename(filename))
     path = filename if os.path.exists(filename) else bundle_path
     if os.path.exists(path):
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(path, 'rb') as f:
+                data = json_loads(f.read())
                 logger.debug(f"Loaded data from {path}")
                 return data
         except (json.JSONDecodeError, UnicodeDecodeError) as e:
@@ -539,6 +701,29 @@ def load_data(filename, default_value):
     logger.debug(f"No {path} found, returning default")
     return default_value
 
+_filament_cache = (None, 0)  # (file key, total grams), replaced as a whole
+
+def get_total_filament_g():
+    """Return total filament used in grams, re-reading TOTAL_FILAMENT_FILE only when it changed.
+
+    The file's inode, mtime and size are the cache key, so writers just keep saving
+    the file as before. Saves swap a new file in with os.replace, so each one gets
+    a new inode and same-size rewrites within one mtime tick are still seen. The
+    cache is published with a single assignment, so callers do not need filament_lock.
+    """
+    global _filament_cache
+    try:
+        st = os.stat(TOTAL_FILAMENT_FILE)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    cached_key, total_g = _filament_cache
+    if key is None or key != cached_key:
+        filament_data = load_data(TOTAL_FILAMENT_FILE, {"total_filament_used_g": 0})
+        total_g = filament_data.get("total_filament_used_g", 0)
+        _filament_cache = (key, total_g)
+    return total_g
+
 def get_ejection_paused():
     """Get the current ejection paused state"""
     global EJECTION_PAUSED
@@ -989,6 +1174,7 @@ def initialize_state():
 
     with SafeLock(orders_lock):
         ORDERS.extend(load_data(ORDERS_FILE, []))
+        mark_orders_changed()
         for order in ORDERS:
             # Handle groups - keep them flexible (can be strings or integers)
             if 'groups' in order:
@@ -1039,6 +1225,7 @@ def initialize_state():
                 printer['service_mode'] = False
             if 'temps' not in printer:
                 printer['temps'] = {"nozzle": 0, "bed": 0}
+        rebuild_printer_indexes()
 
     # Load ejection paused state
     EJECTION_PAUSED = load_data(EJECTION_PAUSED_FILE, False)
@@ -1131,14 +1318,15 @@ def validate_ejection_system():
     return issues
 
 # Start background threads
-threading.Thread(target=monitor_locks, daemon=True).start()
+threading.Thread(target=monitor_locks, daemon=True, name="LockMonitor").start()
 # Check if psutil is available before starting memory monitoring
 if importlib.util.find_spec("psutil") is not None:
-    threading.Thread(target=monitor_memory_usage, daemon=True).start()
+    threading.Thread(target=monitor_memory_usage, daemon=True, name="MemoryMonitor").start()
     logging.info("Memory monitoring started")
 else:
     logging.warning("psutil not installed, memory monitoring disabled")
-threading.Thread(target=reap_threads, daemon=True).start()
+threading.Thread(target=reap_threads, daemon=True, name="ThreadReaper").start()
+threading.Thread(target=persistence_writer, daemon=True, name="PersistenceWriter").start()
 
 def cleanup_mqtt_connections():
     """Clean up MQTT connections on shutdown"""
@@ -4,25 +4,26 @@ Handles fetching printer status from APIs and broadcasting to clients.
 """
 import time
 import asyncio
-import aiohttp
 import threading
-import copy
+import aiohttp
 
 from services.state import (
-    PRINTERS_FILE, TOTAL_FILAMENT_FILE,
-    PRINTERS, ORDERS, save_data, load_data, decrypt_api_key,
-    logging, orders_lock, filament_lock, printers_rwlock,
+    PRINTERS_FILE,
+    PRINTERS, ORDERS, queue_save, decrypt_api_key,
+    logging, orders_lock, printers_rwlock,
     SafeLock, ReadLock, WriteLock,
-    get_printer_ejection_state, clear_printer_ejection_state
+    get_printer_ejection_states, clear_printer_ejection_state, get_printer_index,
+    get_order_by_id, json_loads, get_total_filament_g
 )
 from services.bambu_handler import (
     get_bambu_status, send_bambu_ejection_gcode,
-    BAMBU_PRINTER_STATES, bambu_states_lock
+    BAMBU_PRINTER_STATES, BAMBU_DIRTY, bambu_states_lock
 )
 from services.ejection_manager import (
     clear_stuck_ejection_locks, release_ejection_lock,
     handle_finished_state_ejection, async_send_ejection_gcode
 )
+from services.printer_utils import get_shared_session
 from utils.config import Config
 from utils.retry_utils import retry_async
 from utils.logger import log_state_transition, log_api_poll_event
@@ -35,33 +36,43 @@ from utils.status_poller_helpers import (           # noqa: F401
     _build_minimal_printer,
     _offline_update,
     _ready_update,
+    _JOB_CLEARED,
+    _JOB_RESET,
+    _ejecting_update,
     _api_temps,
 )
 
 
-def update_bambu_printer_states():
-    """Update main printer states from Bambu MQTT data and track filament usage"""
+def update_bambu_printer_states(save=True):
+    """Update main printer states from Bambu MQTT data and track filament usage
+
+    Returns True if any printer changed. With ``save=False`` the caller is
+    responsible for persisting PRINTERS (the poller folds it into its own save).
+    """
     global TOTAL_FILAMENT_CONSUMPTION
 
-    # Get Bambu states snapshot
+    # Drain the printers MQTT has touched since the last poll and snapshot only those
     with bambu_states_lock:
-        bambu_states = copy.deepcopy(BAMBU_PRINTER_STATES)
+        # Values are flat dicts of scalars (hms_alerts is replaced, never mutated), so a
+        # per-printer dict() copy is enough and keeps the MQTT lock hold short
+        bambu_states = {name: dict(BAMBU_PRINTER_STATES[name])
+                        for name in BAMBU_DIRTY if name in BAMBU_PRINTER_STATES}
+        BAMBU_DIRTY.clear()
 
     if not bambu_states:
-        return
+        return False
 
     updates_made = False
 
     with WriteLock(printers_rwlock):
-        for printer in PRINTERS:
-            if printer.get('type') != 'bambu':
+        for printer_name, bambu_state in bambu_states.items():
+            idx = get_printer_index(printer_name)
+            if idx is None:
                 continue
-
-            printer_name = printer.get('name')
-            if printer_name not in bambu_states:
+            printer = PRINTERS[idx]
+            if printer.get('type') != 'bambu':
                 continue
 
-            bambu_state = bambu_states[printer_name]
             current_state = printer.get('state', 'Unknown')
 
             # Skip updates for printers in COOLING state - managed by cooling monitor
@@ -75,8 +86,8 @@ def update_bambu_printer_states():
             # (e.g., FINISHED), but still allow real activity (PRINTING, EJECTING, PREPARE)
             # to come through so the printer can transition when a job actually starts.
             if (printer.get('manually_set', False) and current_state == 'READY'
-                    and new_state not in ['PRINTING', 'EJECTING', 'PREPARE', 'PAUSED']):
-                logging.debug(f"Bambu {printer_name}: preserving manually-set READY state (ignoring MQTT state {new_state})")
+                    and new_state not in _REAL_ACTIVITY_STATES):
+                logging.debug("Bambu %s: preserving manually-set READY state (ignoring MQTT state %s)", printer_name, new_state)
                 # Still update temperatures even when preserving manual state
                 if 'nozzle_temp' in bambu_state:
                     printer['nozzle_temp'] = bambu_state['nozzle_temp']
@@ -107,7 +118,7 @@ def update_bambu_printer_states():
             # Stay in FINISHED until user clicks "Mark Ready" or ejection completes.
             if new_state != current_state:
                 if current_state == 'FINISHED' and new_state == 'READY':
-                    logging.debug(f"Bambu {printer_name}: keeping FINISHED (ignore IDLE->READY until user marks ready)")
+                    logging.debug("Bambu %s: keeping FINISHED (ignore IDLE->READY until user marks ready)", printer_name)
                     # Skip this transition - do not update state
                 else:
                     logging.info(f"Bambu {printer_name} state change: {current_state} -> {new_state}")
@@ -116,7 +127,7 @@ def update_bambu_printer_states():
                     updates_made = True
 
                     # Clear manually_set when printer starts real activity
-                    if new_state in ['PRINTING', 'EJECTING', 'PREPARE'] and printer.get('manually_set', False):
+                    if new_state in _CLEAR_MANUAL_STATES and printer.get('manually_set', False):
                         logging.info(f"Bambu {printer_name}: clearing manually_set flag on transition to {new_state}")
                         printer['manually_set'] = False
 
@@ -124,37 +135,63 @@ def update_bambu_printer_states():
                     if new_state == 'FINISHED' and current_state != 'FINISHED':
                         printer['finish_time'] = time.time()
 
-    if updates_made:
-        save_data(PRINTERS_FILE, PRINTERS)
+        # Snapshot under the lock; the disk write happens on the persistence thread
+        if updates_made and save:
+            queue_save(PRINTERS_FILE, PRINTERS)
+
+    return updates_made
 
 
 def ensure_finish_times():
     """Ensure all FINISHED printers have a finish_time set"""
     with WriteLock(printers_rwlock):
+        updated = False
         for printer in PRINTERS:
             if printer.get('state') == 'FINISHED' and not printer.get('finish_time'):
                 printer['finish_time'] = time.time()
-                logging.debug(f"Set missing finish_time for {printer.get('name')}")
-        save_data(PRINTERS_FILE, PRINTERS)
+                logging.debug("Set missing finish_time for %s", printer.get('name'))
+                updated = True
+        if updated:
+            queue_save(PRINTERS_FILE, PRINTERS)
+
+
+def _prusa_headers(printer):
+    """Build the X-Api-Key headers for a Prusa printer"""
+    return {"X-Api-Key": decrypt_api_key(printer['api_key'])}
+
 
+async def fetch_job(session, printer, headers=None):
+    """Fetch the current job from a Prusa printer's API, or None if unavailable"""
+    if headers is None:
+        headers = _prusa_headers(printer)
+    try:
+        async with session.get(f"http://{printer['ip']}/api/v1/job", headers=headers) as job_res:
+            if job_res.status == 200:
+                return await job_res.json(loads=json_loads)
+    except Exception as e:
+        logging.error(f"Error fetching job for {printer['name']}: {str(e)}")
+    return None
 
-async def fetch_status(session, printer):
+
+async def fetch_status(session, printer, headers=None):
     """Fetch status from a printer's API"""
-    # Check if this is a Bambu printer
+    # Bambu status comes from MQTT state, but may block reconnecting a dropped client;
+    # run it on a worker thread so it doesn't stall the Prusa requests in the same gather
     if printer.get('type') == 'bambu':
-        return get_bambu_status(printer)
+        return await asyncio.to_thread(get_bambu_status, printer)
 
     # Original Prusa code continues below
     url = f"http://{printer['ip']}/api/v1/status"
-    headers = {"X-Api-Key": decrypt_api_key(printer['api_key'])}
-    logging.debug(f"Fetching status for {printer['name']} at {url}")
+    if headers is None:
+        headers = _prusa_headers(printer)
+    logging.debug("Fetching status for %s at %s", printer['name'], url)
 
     async def _fetch():
         try:
             async with session.get(url, headers=headers) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
-                    logging.debug(f"Successfully fetched status for {printer['name']}: {data['printer']['state']}")
+                    data = await resp.json(loads=json_loads)
+                    logging.debug("Successfully fetched status for %s: %s", printer['name'], data['printer']['state'])
                     return printer, data
                 logging.warning(f"Failed to fetch status for {printer['name']}: HTTP {resp.status}")
                 return printer, None
@@ -175,52 +212,150 @@ async def fetch_status(session, printer):
         return printer, None
 
 
+# Polls since the manually_set failsafe last scanned every printer
+_failsafe_counter = 0
+
+# State groups checked for every printer on every poll
+_JOB_STATES = frozenset({'PRINTING', 'PAUSED'})
+_IDLE_STATES = frozenset({'IDLE', 'READY', 'OPERATIONAL'})
+_IDLE_OR_FINISHED_STATES = _IDLE_STATES | {'FINISHED'}
+_FINISHED_RESET_STATES = frozenset({'IDLE', 'OPERATIONAL'})
+_POST_JOB_STATES = _FINISHED_RESET_STATES | {'FINISHED'}
+_NO_JOB_RESET_STATES = frozenset({'PRINTING', 'PAUSED', 'FINISHED', 'EJECTING'})
+_MANUAL_PASSTHROUGH_STATES = frozenset({'PRINTING', 'EJECTING'})
+_KEEP_FINISH_TIME_STATES = frozenset({'FINISHED', 'EJECTING'})
+# Bambu sync and manually_set failsafe
+_CLEAR_MANUAL_STATES = frozenset({'PRINTING', 'EJECTING', 'PREPARE'})
+_REAL_ACTIVITY_STATES = _CLEAR_MANUAL_STATES | {'PAUSED'}
+_MANUAL_OK_STATES = frozenset({'READY', 'PRINTING', 'EJECTING'})
+# Bambu states that mean an ejection has finished
+_BAMBU_EJECTED_STATES = frozenset({'IDLE', 'READY'})
+
+# What clients were last sent by the poller, so later polls can send only what changed.
+# _broadcast_lock guards these and orders every status_update emit against them.
+_broadcast_lock = threading.Lock()
+_last_broadcast_names = None
+_last_broadcast_printers = {}
+_last_broadcast_extras = {}
+_polls_since_full_broadcast = 0
+
+
+def _clear_broadcast_baseline():
+    """Forget what the poller last sent. Caller must hold _broadcast_lock."""
+    global _last_broadcast_names, _last_broadcast_printers, _last_broadcast_extras
+    _last_broadcast_names = None
+    _last_broadcast_printers = {}
+    _last_broadcast_extras = {}
+
+
+def emit_full_status(socketio, payload):
+    """Emit a ``status_update`` from outside the poller and reset its delta baseline.
+
+    Clients then hold values the poller's baseline doesn't know about, so the
+    next poll sends a full snapshot. The emit and the reset happen under the
+    same lock as the poller's own broadcast, so neither can interleave.
+    """
+    with _broadcast_lock:
+        socketio.emit('status_update', payload)
+        _clear_broadcast_baseline()
+
+
 def _apply_printer_updates(printer_updates):
     """Apply collected updates to PRINTERS and run manually_set failsafe.
 
+    Only fields whose value actually differs are written. Returns the number
+    of printers that changed. The failsafe checks the printers updated in this
+    poll every time and the whole fleet every ``Config.FAILSAFE_INTERVAL`` polls.
     Must be called while holding ``WriteLock(printers_rwlock)``.
     """
+    global _failsafe_counter
+    changed_count = 0
+    updated_printers = []
     for update in printer_updates:
-        if 0 <= update['index'] < len(PRINTERS):
-            current_manually_set = PRINTERS[update['index']].get('manually_set', False)
+        index = update['index']
+        name = update.get('name')
+        if name is not None and not (0 <= index < len(PRINTERS) and PRINTERS[index].get('name') == name):
+            # PRINTERS was reordered while we were polling - find the printer by name
+            index = get_printer_index(name)
+            if index is None:
+                continue
+            update['index'] = index
+
+        if 0 <= index < len(PRINTERS):
+            printer = PRINTERS[index]
+            current_manually_set = printer.get('manually_set', False)
             new_manually_set = update['updates'].get('manually_set', current_manually_set)
             if current_manually_set and not new_manually_set and update['updates'].get('state') != 'PRINTING':
-                logging.warning(f"WARNING: Printer {PRINTERS[update['index']]['name']} manually_set changing from True to False!")
-                if current_manually_set and PRINTERS[update['index']]['state'] == 'READY':
-                    logging.warning(f"Preventing manual flag from being cleared for READY printer {PRINTERS[update['index']]['name']}")
+                logging.warning(f"WARNING: Printer {printer['name']} manually_set changing from True to False!")
+                if current_manually_set and printer['state'] == 'READY':
+                    logging.warning(f"Preventing manual flag from being cleared for READY printer {printer['name']}")
                     update['updates']['manually_set'] = True
 
-            if (PRINTERS[update['index']].get('state') == 'READY' and
+            if (printer.get('state') == 'READY' and
                 update['updates'].get('state') == 'FINISHED' and
-                (PRINTERS[update['index']].get('file') is None or PRINTERS[update['index']].get('ejection_processed', False))):
-                logging.debug(f"Preserving READY state for {PRINTERS[update['index']]['name']} despite API FINISHED state")
+                (printer.get('file') is None or printer.get('ejection_processed', False))):
+                logging.debug("Preserving READY state for %s despite API FINISHED state", printer['name'])
                 update['updates']['state'] = 'READY'
                 update['updates']['status'] = 'Ready'
                 update['updates']['manually_set'] = True
 
-            old_state = PRINTERS[update['index']].get('state')
+            old_state = printer.get('state')
             new_state = update['updates'].get('state')
             if new_state and old_state != new_state:
-                logging.info(f"Printer {PRINTERS[update['index']]['name']} state: {old_state} -> {new_state}")
+                logging.info(f"Printer {printer['name']} state: {old_state} -> {new_state}")
 
-            for key, value in update['updates'].items():
-                PRINTERS[update['index']][key] = value
+            delta = {key: value for key, value in update['updates'].items()
+                     if key not in printer or printer[key] != value}
+            if delta:
+                printer.update(delta)
+                changed_count += 1
+            updated_printers.append(printer)
 
     # Failsafe for manually_set printers
-    for i, printer in enumerate(PRINTERS):
-        if printer.get('manually_set', False) and printer.get('state') not in ['READY', 'PRINTING', 'EJECTING']:
+    _failsafe_counter += 1
+    if _failsafe_counter >= Config.FAILSAFE_INTERVAL:
+        _failsafe_counter = 0
+        updated_printers = PRINTERS
+    for printer in updated_printers:
+        if printer.get('manually_set', False) and printer.get('state') not in _MANUAL_OK_STATES:
             logging.warning(f"Failsafe: Fixing printer {printer['name']} - has manually_set=True but state={printer['state']}. Setting back to READY")
             printer['state'] = 'READY'
             printer['status'] = 'Ready'
             printer['manually_set'] = True
             printer['count_incremented_for_current_job'] = False
+            changed_count += 1
+
+    return changed_count
+
+
+def _clear_claimed_ejections(claimed_ejections):
+    """Clear pending_ejection for ejections this poll sent. Returns how many were cleared.
+
+    A slot is only cleared if it still holds the same request, so an ejection
+    queued while the send was in flight is kept for the next poll.
+    Must be called with printers_rwlock held for writing.
+    """
+    cleared = 0
+    for index, name, pending_ejection in claimed_ejections:
+        if index >= len(PRINTERS) or PRINTERS[index].get('name') != name:
+            index = get_printer_index(name)
+            if index is None:
+                continue
+        if PRINTERS[index].get('pending_ejection') is pending_ejection:
+            PRINTERS[index]['pending_ejection'] = None
+            cleared += 1
+    return cleared
 
 
-def _monitor_ejection_completion(printer, printer_index, printer_updates, start_bg_dist):
+def _monitor_ejection_completion(printer, printer_index, api_updates, ejection_state, start_bg_dist, after_unlock):
     """Check if an EJECTING printer has completed and transition to READY.
 
     Must be called while holding ``WriteLock(printers_rwlock)``.
+    *api_updates* maps PRINTERS index to this poll's update dict.
+    *ejection_state* is the printer's entry from the ejection state manager.
     *start_bg_dist* is a callable that triggers background order distribution.
+    Side effects are appended to *after_unlock* for the caller to run once the
+    write lock is released. Returns True if the printer was changed.
     """
     printer_name = printer['name']
     printer_type = printer.get('type', 'prusa')
@@ -228,25 +363,23 @@ def _monitor_ejection_completion(printer, printer_index, printer_updates, start_
     ejection_start = printer.get('ejection_start_time', 0)
     elapsed_minutes = (current_time - ejection_start) / 60.0 if ejection_start else 0
 
-    # Find the API state from the latest update for this printer
+    # API state from this poll's update for the printer, if it was polled
     api_state = None
     current_api_file = None
-    for update in printer_updates:
-        if update['index'] == printer_index:
-            api_state = update['updates'].get('state')
-            current_api_file = update['updates'].get('file', '')
-            break
+    api_update = api_updates.get(printer_index)
+    if api_update is not None:
+        api_state = api_update.get('state')
+        current_api_file = api_update.get('file', '')
 
-    logging.debug(f"Ejection check for {printer_name} (type: {printer_type}): api_state={api_state}, api_file='{current_api_file}', stored_file='{printer.get('file', '')}', elapsed={elapsed_minutes:.1f}min")
+    logging.debug("Ejection check for %s (type: %s): api_state=%s, api_file='%s', stored_file='%s', elapsed=%.1fmin", printer_name, printer_type, api_state, current_api_file, printer.get('file', ''), elapsed_minutes)
 
     ejection_complete = False
     completion_reason = ""
 
-    ejection_state = get_printer_ejection_state(printer_name)
     if ejection_state['state'] == 'completed':
         ejection_complete = True
         completion_reason = "State manager shows completed"
-    elif api_state in ['IDLE', 'READY', 'OPERATIONAL']:
+    elif api_state in _IDLE_STATES:
         ejection_complete = True
         completion_reason = f"API state = {api_state}"
     elif printer_type != 'bambu':
@@ -266,7 +399,7 @@ def _monitor_ejection_completion(printer, printer_index, printer_updates, start_
                     if bambu_state.get('ejection_complete', False):
                         ejection_complete = True
                         completion_reason = "Bambu ejection_complete flag"
-                    elif bambu_state.get('state', '') in ['IDLE', 'READY']:
+                    elif bambu_state.get('state', '') in _BAMBU_EJECTED_STATES:
                         ejection_complete = True
                         completion_reason = f"Bambu state = {bambu_state.get('state', '')}"
         except Exception as e:
@@ -277,24 +410,49 @@ def _monitor_ejection_completion(printer, printer_index, printer_updates, start_
 
         printer.update(_ready_update(
             order_id=None, ejection_processed=False,
-            manual_timeout=time.time() + 300,
+            manual_timeout=current_time + 300,
             ejection_start_time=None, finish_time=None,
-            last_ejection_time=time.time(),
+            last_ejection_time=current_time,
             count_incremented_for_current_job=False,
         ))
 
-        release_ejection_lock(printer_name)
-        clear_printer_ejection_state(printer_name)
-        start_bg_dist()
-    else:
-        if elapsed_minutes > 5:
-            logging.info(f"Ejection still in progress for {printer_name}: {elapsed_minutes:.1f} minutes elapsed")
+        after_unlock.append(lambda: release_ejection_lock(printer_name))
+        after_unlock.append(lambda: clear_printer_ejection_state(printer_name))
+        after_unlock.append(start_bg_dist)
+        return True
+
+    if elapsed_minutes > 5:
+        logging.info(f"Ejection still in progress for {printer_name}: {elapsed_minutes:.1f} minutes elapsed")
+    return False
+
+
+def _send_cooled_ejection(printer, gcode_content):
+    """Send the post-cooling Bambu ejection and roll the printer back to READY on failure.
+
+    Runs after the poll's write lock is released, since the MQTT send paces each
+    G-code line and can take seconds.
+    """
+    printer_name = printer['name']
+    if send_bambu_ejection_gcode(printer, gcode_content):
+        return
+
+    logging.error(f"Bambu ejection failed for {printer_name} after cooling")
+    with WriteLock(printers_rwlock):
+        idx = get_printer_index(printer_name)
+        if idx is not None and PRINTERS[idx].get('state') == 'EJECTING':
+            PRINTERS[idx].update({
+                "state": 'READY', "status": 'Ready',
+                "ejection_processed": False, "ejection_in_progress": False,
+                "manually_set": True,
+            })
 
 
-def _monitor_cooling_state(printer):
+def _monitor_cooling_state(printer, after_unlock):
     """Check if a COOLING printer has reached target temp and act.
 
-    Must be called while holding ``WriteLock(printers_rwlock)``.
+    Must be called while holding ``WriteLock(printers_rwlock)``. The ejection
+    send is appended to *after_unlock* rather than run under the lock.
+    Returns True if the printer was changed.
     """
     printer_name = printer['name']
     cooldown_target = printer.get('cooldown_target_temp', 0)
@@ -308,13 +466,15 @@ def _monitor_cooling_state(printer):
     except Exception as e:
         logging.warning(f"Could not get bed temp for {printer_name}: {e}")
 
-    printer['status'] = f'Cooling ({current_bed_temp}°C → {cooldown_target}°C)'
+    status = f'Cooling ({current_bed_temp}°C → {cooldown_target}°C)'
+    status_changed = printer.get('status') != status
+    printer['status'] = status
 
     if current_bed_temp <= cooldown_target:
         logging.info(f"COOLING->EJECTING: {printer_name} (bed temp {current_bed_temp}°C <= target {cooldown_target}°C)")
 
         with SafeLock(orders_lock):
-            order = next((o for o in ORDERS if o['id'] == cooldown_order_id), None)
+            order = get_order_by_id(cooldown_order_id)
 
         if order and order.get('ejection_enabled', False):
             gcode_content = order.get('end_gcode', '').strip()
@@ -329,14 +489,9 @@ def _monitor_cooling_state(printer):
                 "cooldown_target_temp": None, "cooldown_order_id": None,
             })
 
-            success = send_bambu_ejection_gcode(printer, gcode_content)
-            if not success:
-                logging.error(f"Bambu ejection failed for {printer_name} after cooling")
-                printer.update({
-                    "state": 'READY', "status": 'Ready',
-                    "ejection_processed": False, "ejection_in_progress": False,
-                    "manually_set": True,
-                })
+            printer_copy = printer.copy()
+            after_unlock.append(lambda: _send_cooled_ejection(printer_copy, gcode_content))
+            return True
         else:
             logging.warning(f"COOLING->READY: {printer_name} (order not found or ejection not enabled)")
             printer.update({
@@ -345,372 +500,446 @@ def _monitor_cooling_state(printer):
                 "manually_set": True,
                 "cooldown_target_temp": None, "cooldown_order_id": None,
             })
-    else:
-        finish_time = printer.get('finish_time', time.time())
-        cooling_minutes = (time.time() - finish_time) / 60.0
-        if int(cooling_minutes) % 2 == 0 and cooling_minutes > 0:
-            logging.debug(f"COOLING: {printer_name} at {current_bed_temp}°C, target {cooldown_target}°C ({cooling_minutes:.1f}min elapsed)")
+            return True
+
+    now = time.time()
+    finish_time = printer.get('finish_time', now)
+    cooling_minutes = (now - finish_time) / 60.0
+    if int(cooling_minutes) % 2 == 0 and cooling_minutes > 0:
+        logging.debug("COOLING: %s at %s°C, target %s°C (%.1fmin elapsed)", printer_name, current_bed_temp, cooldown_target, cooling_minutes)
+    return status_changed
+
+
+def _copy_orders(orders):
+    """Copy orders for broadcast: each order dict and its list fields (e.g. groups).
+
+    Orders are flat apart from list values, so this two-level copy is enough to
+    detach the snapshot and is much cheaper than copy.deepcopy.
+    """
+    return [{key: (value[:] if isinstance(value, list) else value) for key, value in order.items()}
+            for order in orders]
+
+
+def _broadcast_poll_results(socketio, printers_copy, total_filament, orders):
+    """Send poll results to clients, as per-printer deltas when possible.
+
+    A full ``status_update`` goes out when printers were added, removed or
+    reordered, after ``emit_full_status``, and every
+    ``Config.FULL_BROADCAST_INTERVAL`` polls as a periodic resync. Otherwise a single
+    ``status_update`` carries ``printer_deltas`` (changed fields plus name for
+    each changed printer) and orders/filament only when they differ from the
+    last broadcast, so one poll is at most one frame. Fields a printer no
+    longer has are listed under the delta's ``removed`` key, so a ``None``
+    value always means the field is now None. Runs under
+    ``_broadcast_lock`` so ``emit_full_status`` can't land mid-broadcast.
+    """
+    global _last_broadcast_names, _last_broadcast_printers, _last_broadcast_extras, _polls_since_full_broadcast
+
+    with _broadcast_lock:
+        names = [p.get('name') for p in printers_copy]
+        extras = {'total_filament': total_filament, 'orders': orders}
+        _polls_since_full_broadcast += 1
+
+        if names != _last_broadcast_names or _polls_since_full_broadcast >= Config.FULL_BROADCAST_INTERVAL:
+            socketio.emit('status_update', {'printers': printers_copy, **extras})
+            _polls_since_full_broadcast = 0
+        else:
+            payload = {key: value for key, value in extras.items()
+                       if key not in _last_broadcast_extras or _last_broadcast_extras[key] != value}
+            deltas = []
+            for printer in printers_copy:
+                previous = _last_broadcast_printers.get(printer['name'], {})
+                delta = {key: value for key, value in printer.items()
+                         if key not in previous or previous[key] != value}
+                removed = previous.keys() - printer.keys()
+                if removed:
+                    delta['removed'] = sorted(removed)
+                if delta:
+                    delta['name'] = printer['name']
+                    deltas.append(delta)
+            if deltas:
+                payload['printer_deltas'] = deltas
+            if payload:
+                socketio.emit('status_update', payload)
+
+        _last_broadcast_names = names
+        _last_broadcast_printers = {p['name']: p for p in printers_copy}
+        _last_broadcast_extras = extras
 
 
 async def get_printer_status_async(socketio, app, batch_index=None, batch_size=None):
     """Main status polling function - fetches status from all printers and updates state"""
     # Import here to avoid circular imports
-    from services.order_distributor import start_background_distribution
-
-    global TOTAL_FILAMENT_CONSUMPTION
+    from services.order_distributor import schedule_background_distribution
 
     # Clear any stuck ejection locks before processing
     clear_stuck_ejection_locks()
 
-    # Update Bambu printer states first
-    update_bambu_printer_states()
+    # Update Bambu printer states first; they are saved together with this poll's updates
+    bambu_changed = update_bambu_printer_states(save=False)
 
     if batch_size is None:
         batch_size = Config.STATUS_BATCH_SIZE
 
+    # Select this batch and copy only the fields polling needs, keeping each printer's
+    # real PRINTERS index (service-mode printers are skipped)
     with ReadLock(printers_rwlock):
-        all_printers = [p.copy() for p in PRINTERS if not p.get('service_mode', False)]
-
-    # Select the slice of printers for this batch
-    if batch_index is not None:
-        start_idx = batch_index * batch_size
-        batch_printers = all_printers[start_idx:start_idx + batch_size]
-    else:
-        start_idx = 0
-        batch_printers = all_printers
-
-    printers_to_process = [_build_minimal_printer(p) for p in batch_printers]
-    printer_indices = list(range(start_idx, start_idx + len(printers_to_process)))
+        batch_printers = [(i, p) for i, p in enumerate(PRINTERS) if not p.get('service_mode', False)]
+        if batch_index is not None:
+            start_idx = batch_index * batch_size
+            batch_printers = batch_printers[start_idx:start_idx + batch_size]
+        printers_to_process = [_build_minimal_printer(p) for _, p in batch_printers]
+        printer_indices = [i for i, _ in batch_printers]
 
     if not printers_to_process:
-        logging.debug(f"No printers to process in batch {batch_index}")
+        logging.debug("No printers to process in batch %s", batch_index)
+        if bambu_changed:
+            with ReadLock(printers_rwlock):
+                queue_save(PRINTERS_FILE, PRINTERS)
         return
 
-    await asyncio.sleep(0.01)
-
     printer_updates = []
     ejection_tasks = []
-
-    async with aiohttp.ClientSession(
-        connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
-        timeout=aiohttp.ClientTimeout(total=Config.API_TIMEOUT)
-    ) as session:
-        for idx, p in enumerate(printers_to_process):
-            if p.get('manually_set', False):
-                logging.debug(f"Processing manually set printer {p['name']}: Current state={p.get('state', 'Unknown')}")
-
-        tasks = [fetch_status(session, p) for p in printers_to_process]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for idx, result in enumerate(results):
-            if isinstance(result, Exception):
-                logging.error(f"Error fetching status for {printers_to_process[idx]['name']}: {str(result)}")
+    claimed_ejections = []  # (index, name, pending_ejection) sent this poll, cleared under the final write lock
+
+    session = get_shared_session()
+    for idx, p in enumerate(printers_to_process):
+        if p.get('manually_set', False):
+            logging.debug("Processing manually set printer %s: Current state=%s", p['name'], p.get('state', 'Unknown'))
+
+    # Build each Prusa printer's headers once and share them across this poll's requests
+    poll_headers = [None if p.get('type') == 'bambu' else _prusa_headers(p) for p in printers_to_process]
+    tasks = [fetch_status(session, p, h) for p, h in zip(printers_to_process, poll_headers)]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Prusa printers that are mid-print also need /job; fetch those together in one round
+    job_indices = [
+        idx for idx, result in enumerate(results)
+        if not isinstance(result, Exception) and result[1]
+        and result[0].get('type') != 'bambu'
+        and result[1]['printer']['state'] in _JOB_STATES
+    ]
+    job_data_list = await asyncio.gather(*(fetch_job(session, results[i][0], poll_headers[i]) for i in job_indices))
+    job_results = dict(zip(job_indices, job_data_list))
+
+    # Read the stored fields the loop below needs in one pass, after the fetches complete.
+    # PRINTERS may have been reordered during the awaits, so entries are keyed and resolved by name.
+    db_snapshot = {}
+    with ReadLock(printers_rwlock):
+        for i, p in zip(printer_indices, printers_to_process):
+            name = p['name']
+            if not (i < len(PRINTERS) and PRINTERS[i].get('name') == name):
+                i = get_printer_index(name)
+                if i is None:
+                    continue
+            stored = PRINTERS[i]
+            db_snapshot[name] = {
+                'index': i,
+                'state': stored.get('state', 'Unknown'),
+                'ejection_processed': stored.get('ejection_processed', False),
+                'finish_time': stored.get('finish_time'),
+                'pending_ejection': stored.get('pending_ejection'),
+            }
+
+    # One timestamp for every finish/ejection/timeout check in this poll
+    poll_time = time.time()
+    for idx, result in enumerate(results):
+        if isinstance(result, Exception):
+            logging.error(f"Error fetching status for {printers_to_process[idx]['name']}: {str(result)}")
+            printer_updates.append({
+                'index': printer_indices[idx],
+                'name': printers_to_process[idx]['name'],
+                'updates': _offline_update(),
+            })
+            continue
+
+        printer, data = result
+        printer_name = printer['name']
+        if data:
+            api_state = data['printer']['state']
+            api_temps = _api_temps(data)
+            manually_set = printer.get('manually_set', False)
+            current_state = printer.get('state', 'Unknown')
+            ejection_processed = printer.get('ejection_processed', False)
+            ejection_in_progress = printer.get('ejection_in_progress', False)
+            current_file = printer.get('file', '')
+            current_order_id = printer.get('order_id')
+
+            db_printer = db_snapshot.get(printer_name)
+            if db_printer is not None:
+                database_state = db_printer['state']
+                database_ejection_processed = db_printer['ejection_processed']
+                logging.debug("Printer %s: API state=%s, Copied state=%s, Database state=%s, manually_set=%s, ejection_processed=%s, db_ejection_processed=%s, ejection_in_progress=%s", printer_name, api_state, current_state, database_state, manually_set, ejection_processed, database_ejection_processed, ejection_in_progress)
+
+            updates = {}
+
+            # Skip normal state updates for printers in COOLING state
+            if db_printer is not None and db_printer['state'] == 'COOLING':
+                logging.debug("Skipping status update for %s - in COOLING state (API reports: %s)", printer_name, api_state)
                 printer_updates.append({
                     'index': printer_indices[idx],
-                    'updates': _offline_update(),
+                    'name': printer_name,
+                    'updates': {
+                        "temps": api_temps['temps'],
+                        "bed_temp": api_temps['temps']['bed'],
+                    }
                 })
                 continue
 
-            printer, data = result
-            if data:
-                api_state = data['printer']['state']
-                manually_set = printer.get('manually_set', False)
-                current_state = printer.get('state', 'Unknown')
-                ejection_processed = printer.get('ejection_processed', False)
-                ejection_in_progress = printer.get('ejection_in_progress', False)
-                current_file = printer.get('file', '')
-                current_order_id = printer.get('order_id')
-
-                with ReadLock(printers_rwlock):
-                    if printer_indices[idx] < len(PRINTERS):
-                        database_state = PRINTERS[printer_indices[idx]].get('state', 'Unknown')
-                        database_ejection_processed = PRINTERS[printer_indices[idx]].get('ejection_processed', False)
-                        logging.debug(f"Printer {printer['name']}: API state={api_state}, Copied state={current_state}, Database state={database_state}, manually_set={manually_set}, ejection_processed={ejection_processed}, db_ejection_processed={database_ejection_processed}, ejection_in_progress={ejection_in_progress}")
-
-                updates = {}
-
-                # Skip normal state updates for printers in COOLING state
-                with ReadLock(printers_rwlock):
-                    if printer_indices[idx] < len(PRINTERS):
-                        actual_db_state = PRINTERS[printer_indices[idx]].get('state', 'Unknown')
-                        if actual_db_state == 'COOLING':
-                            logging.debug(f"Skipping status update for {printer['name']} - in COOLING state (API reports: {api_state})")
-                            printer_updates.append({
-                                'index': printer_indices[idx],
-                                'updates': {
-                                    "temps": {"bed": data['printer'].get('temp_bed', 0), "nozzle": data['printer'].get('temp_nozzle', 0)},
-                                    "bed_temp": data['printer'].get('temp_bed', 0),
-                                }
-                            })
-                            continue
+            if manually_set and api_state not in _MANUAL_PASSTHROUGH_STATES:
+                if api_state == 'FINISHED':
+                    logging.debug("Printer %s has finished printing, using enhanced FINISHED handler", printer_name)
+                    handle_finished_state_ejection(printer, printer_name, current_file, current_order_id, updates)
 
-                if manually_set and api_state not in ['PRINTING', 'EJECTING']:
-                    if api_state == 'FINISHED':
-                        logging.debug(f"Printer {printer['name']} has finished printing, using enhanced FINISHED handler")
-                        handle_finished_state_ejection(printer, printer['name'], current_file, current_order_id, updates)
-
-                        if updates.get('state') == 'EJECTING':
-                            updates['ejection_in_progress'] = True
+                    if updates.get('state') == 'EJECTING':
+                        updates['ejection_in_progress'] = True
+                else:
+                    manual_timeout = printer.get('manual_timeout', 0)
+                    if manual_timeout > 0 and poll_time < manual_timeout:
+                        logging.debug("Manual state timeout active for %s, preserving READY state", printer_name)
                     else:
-                        manual_timeout = printer.get('manual_timeout', 0)
-                        if manual_timeout > 0 and time.time() < manual_timeout:
-                            logging.debug(f"Manual state timeout active for {printer['name']}, preserving READY state")
-                        else:
-                            logging.debug(f"Preserving manually set state for {printer['name']} despite API state {api_state}")
-                        updates = _ready_update(
-                            **_api_temps(data),
-                            ejection_processed=ejection_processed,
-                            count_incremented_for_current_job=printer.get('count_incremented_for_current_job', False),
-                        )
-                elif ejection_processed and current_state == 'READY':
-                    logging.debug(f"Preserving READY state for {printer['name']} due to prior ejection, ignoring API state {api_state}")
+                        logging.debug("Preserving manually set state for %s despite API state %s", printer_name, api_state)
                     updates = _ready_update(
-                        **_api_temps(data),
-                        order_id=None,
-                        ejection_processed=True,
+                        **api_temps,
+                        ejection_processed=ejection_processed,
                         count_incremented_for_current_job=printer.get('count_incremented_for_current_job', False),
                     )
-                elif ejection_in_progress and current_state == 'EJECTING' and api_state in ['IDLE', 'READY', 'OPERATIONAL', 'FINISHED']:
-                    logging.debug(f"Maintaining EJECTING state for {printer['name']} as ejection is in progress internally, ignoring API state {api_state}")
-                    updates = {
-                        "state": 'EJECTING',
-                        "status": 'Ejecting',
-                        "temps": {"bed": data['printer'].get('temp_bed', 0), "nozzle": data['printer'].get('temp_nozzle', 0)},
-                        "z_height": data['printer'].get('axis_z', 0),
-                        "progress": 0,
-                        "time_remaining": 0,
-                        "file": current_file,
-                        "job_id": None,
-                        "manually_set": False,
-                        "ejection_processed": ejection_processed,
-                        "ejection_in_progress": ejection_in_progress,
-                        "count_incremented_for_current_job": printer.get('count_incremented_for_current_job', False)
-                    }
-                elif current_state == 'EJECTING' and api_state == 'PRINTING' and current_file and 'ejection_' in current_file:
-                    logging.debug(f"Maintaining EJECTING state for {printer['name']} as API reports PRINTING for ejection file {current_file}")
-                    updates = {
-                        "state": 'EJECTING',
-                        "status": 'Ejecting',
-                        "temps": {"bed": data['printer'].get('temp_bed', 0), "nozzle": data['printer'].get('temp_nozzle', 0)},
-                        "z_height": data['printer'].get('axis_z', 0),
-                        "progress": 0,
-                        "time_remaining": 0,
-                        "file": current_file,
-                        "job_id": None,
-                        "manually_set": False,
-                        "ejection_processed": ejection_processed,
-                        "ejection_in_progress": ejection_in_progress,
-                        "count_incremented_for_current_job": printer.get('count_incremented_for_current_job', False)
-                    }
-                else:
-                    # Handle Bambu printer state mapping
-                    if printer.get('type') == 'bambu' and api_state in ['PREPARING']:
-                        api_state = 'PREPARE'
-                    updates = {
-                        "state": api_state,
-                        "status": state_map.get(api_state, 'Unknown'),
-                        "temps": {"bed": data['printer'].get('temp_bed', 0), "nozzle": data['printer'].get('temp_nozzle', 0)},
-                        "z_height": data['printer'].get('axis_z', 0),
-                        "ejection_in_progress": False
-                    }
+            elif ejection_processed and current_state == 'READY':
+                logging.debug("Preserving READY state for %s due to prior ejection, ignoring API state %s", printer_name, api_state)
+                updates = _ready_update(
+                    **api_temps,
+                    order_id=None,
+                    ejection_processed=True,
+                    count_incremented_for_current_job=printer.get('count_incremented_for_current_job', False),
+                )
+            elif current_state == 'EJECTING' and (
+                    (ejection_in_progress and api_state in _IDLE_OR_FINISHED_STATES)
+                    or (api_state == 'PRINTING' and current_file and 'ejection_' in current_file)):
+                # Either ejection is still running internally, or the API is printing the ejection file
+                logging.debug("Maintaining EJECTING state for %s, ignoring API state %s (file %s)", printer_name, api_state, current_file)
+                updates = _ejecting_update(
+                    **api_temps,
+                    file=current_file,
+                    ejection_processed=ejection_processed,
+                    ejection_in_progress=ejection_in_progress,
+                    count_incremented_for_current_job=printer.get('count_incremented_for_current_job', False),
+                )
+            else:
+                # Handle Bambu printer state mapping
+                if printer.get('type') == 'bambu' and api_state == 'PREPARING':
+                    api_state = 'PREPARE'
+                updates = {
+                    "state": api_state,
+                    "status": state_map.get(api_state, 'Unknown'),
+                    **api_temps,
+                    "ejection_in_progress": False
+                }
+
+                if api_state != current_state:
+                    log_api_poll_event(
+                        printer_name,
+                        api_state,
+                        current_state,
+                        'state_update' if not manually_set else 'manual_override',
+                        {
+                            'manually_set': manually_set,
+                            'ejection_processed': ejection_processed
+                        }
+                    )
 
-                    if api_state != current_state:
-                        log_api_poll_event(
-                            printer['name'],
-                            api_state,
-                            current_state,
-                            'state_update' if not manually_set else 'manual_override',
-                            {
-                                'manually_set': manually_set,
-                                'ejection_processed': ejection_processed
-                            }
-                        )
-
-                    if api_state in ['PRINTING', 'PAUSED']:
-                        if printer.get('type') != 'bambu':
-                            headers = {"X-Api-Key": decrypt_api_key(printer['api_key'])}
-                            try:
-                                async with session.get(f"http://{printer['ip']}/api/v1/job", headers=headers) as job_res:
-                                    if job_res.status == 200:
-                                        job_data = await job_res.json()
-                                        updates.update({
-                                            "progress": job_data.get('progress', 0),
-                                            "time_remaining": job_data.get('time_remaining', 0),
-                                            "file": job_data.get('file', {}).get('display_name', 'Unknown'),
-                                            "job_id": job_data.get('id'),
-                                            "manually_set": manually_set,
-                                            "ejection_processed": False,
-                                            "ejection_in_progress": False,
-                                            "finish_time": None,
-                                            "count_incremented_for_current_job": printer.get('count_incremented_for_current_job', False)
-                                        })
-                                    else:
-                                        updates.update({"progress": 0, "time_remaining": 0, "file": "None", "job_id": None})
-                            except Exception as e:
-                                logging.error(f"Error fetching job for {printer['name']}: {str(e)}")
-                                updates.update({"progress": 0, "time_remaining": 0, "file": "None", "job_id": None})
-                        else:
+                if api_state in _JOB_STATES:
+                    if printer.get('type') != 'bambu':
+                        job_data = job_results.get(idx)
+                        if job_data is not None:
                             updates.update({
-                                "progress": data.get('progress', 0),
-                                "time_remaining": data.get('time_remaining', 0),
-                                "file": data.get('file', {}).get('display_name', data.get('file', 'Unknown')),
-                                "job_id": None,
+                                "progress": job_data.get('progress', 0),
+                                "time_remaining": job_data.get('time_remaining', 0),
+                                "file": job_data.get('file', {}).get('display_name', 'Unknown'),
+                                "job_id": job_data.get('id'),
                                 "manually_set": manually_set,
                                 "ejection_processed": False,
                                 "ejection_in_progress": False,
                                 "finish_time": None,
                                 "count_incremented_for_current_job": printer.get('count_incremented_for_current_job', False)
                             })
-                    elif api_state == 'FINISHED':
-                        handle_finished_state_ejection(printer, printer['name'], current_file, current_order_id, updates)
-
-                        if updates.get('state') == 'EJECTING':
-                            updates['ejection_in_progress'] = True
-
-                    elif api_state in ['IDLE', 'FINISHED', 'OPERATIONAL']:
-                        original_printer_index = printer_indices[idx]
-                        with ReadLock(printers_rwlock):
-                            if 0 <= original_printer_index < len(PRINTERS):
-                                stored_state = PRINTERS[original_printer_index].get('state', 'Unknown')
-                                stored_finish_time = PRINTERS[original_printer_index].get('finish_time')
-
-                                logging.debug(f"Checking printer {printer['name']}: API state={api_state}, stored state={stored_state}, stored_finish_time={stored_finish_time}")
-
-                                if stored_finish_time:
-                                    updates['finish_time'] = stored_finish_time
-                                    logging.debug(f"Preserving existing finish_time for {printer['name']}: {stored_finish_time}")
-                                elif stored_state == 'FINISHED' or api_state == 'FINISHED':
-                                    finish_time = time.time()
-                                    updates['finish_time'] = finish_time
-                                    logging.debug(f"Setting new finish_time for {printer['name']}: {finish_time}")
-                                else:
-                                    if stored_state == 'FINISHED' and api_state not in ['FINISHED', 'EJECTING']:
-                                        updates['finish_time'] = None
-                                        logging.info(f"Clearing finish_time for {printer['name']} - transitioning from FINISHED to {api_state}")
-                                    else:
-                                        updates['finish_time'] = None
-
-                                if stored_state == 'FINISHED' and api_state in ['IDLE', 'OPERATIONAL']:
-                                    logging.info(f"Printer {printer['name']} manually reset from FINISHED to {api_state} - transitioning to READY")
-                                    log_state_transition(
-                                        printer['name'],
-                                        'FINISHED',
-                                        'READY',
-                                        'MANUAL_RESET_DETECTED',
-                                        {'api_state': api_state, 'reason': 'Manual reset detected, auto-transitioning to READY'}
-                                    )
-                                    updates.update(_ready_update(
-                                        order_id=None, ejection_processed=False,
-                                        ejection_start_time=None, finish_time=None,
-                                        count_incremented_for_current_job=False,
-                                    ))
-                                    threading.Timer(2.0, lambda: start_background_distribution(socketio, app)).start()
-                                elif stored_state == 'EJECTING':
-                                    logging.warning(f"IMPORTANT: Printer {printer['name']} completed ejection (API={api_state}), transitioning from EJECTING to READY")
-                                    updates.update(_ready_update(
-                                        order_id=None, ejection_processed=False,
-                                        ejection_start_time=None, finish_time=None,
-                                        last_ejection_time=time.time(),
-                                        count_incremented_for_current_job=False,
-                                    ))
-                                    release_ejection_lock(printer['name'])
-                                    clear_printer_ejection_state(printer['name'])
-                                else:
-                                    updates.update({
-                                        "state": api_state,
-                                        "status": state_map.get(api_state, 'Unknown'),
-                                        "progress": 0,
-                                        "time_remaining": 0,
-                                        "file": "None",
-                                        "job_id": None,
-                                        "manually_set": False,
-                                        "ejection_in_progress": False,
-                                        "count_incremented_for_current_job": False
-                                    })
-                    elif api_state not in ['PRINTING', 'PAUSED', 'FINISHED', 'EJECTING']:
-                        updates.update({"progress": 0, "time_remaining": 0, "file": "None", "job_id": None, "manually_set": False, "finish_time": None, "ejection_in_progress": False, "count_incremented_for_current_job": False})
-
-                printer_updates.append({
-                    'index': printer_indices[idx],
-                    'updates': updates
-                })
+                        else:
+                            updates.update(_JOB_CLEARED)
+                    else:
+                        updates.update({
+                            "progress": data.get('progress', 0),
+                            "time_remaining": data.get('time_remaining', 0),
+                            "file": data.get('file', {}).get('display_name', data.get('file', 'Unknown')),
+                            "job_id": None,
+                            "manually_set": manually_set,
+                            "ejection_processed": False,
+                            "ejection_in_progress": False,
+                            "finish_time": None,
+                            "count_incremented_for_current_job": printer.get('count_incremented_for_current_job', False)
+                        })
+                elif api_state == 'FINISHED':
+                    handle_finished_state_ejection(printer, printer_name, current_file, current_order_id, updates)
+
+                    if updates.get('state') == 'EJECTING':
+                        updates['ejection_in_progress'] = True
+
+                elif api_state in _POST_JOB_STATES:
+                    if db_printer is not None:
+                        stored_state = db_printer['state']
+                        stored_finish_time = db_printer['finish_time']
+
+                        logging.debug("Checking printer %s: API state=%s, stored state=%s, stored_finish_time=%s", printer_name, api_state, stored_state, stored_finish_time)
+
+                        if stored_finish_time:
+                            updates['finish_time'] = stored_finish_time
+                            logging.debug("Preserving existing finish_time for %s: %s", printer_name, stored_finish_time)
+                        elif stored_state == 'FINISHED' or api_state == 'FINISHED':
+                            finish_time = poll_time
+                            updates['finish_time'] = finish_time
+                            logging.debug("Setting new finish_time for %s: %s", printer_name, finish_time)
+                        else:
+                            if stored_state == 'FINISHED' and api_state not in _KEEP_FINISH_TIME_STATES:
+                                updates['finish_time'] = None
+                                logging.info(f"Clearing finish_time for {printer_name} - transitioning from FINISHED to {api_state}")
+                            else:
+                                updates['finish_time'] = None
+
+                        if stored_state == 'FINISHED' and api_state in _FINISHED_RESET_STATES:
+                            logging.info(f"Printer {printer_name} manually reset from FINISHED to {api_state} - transitioning to READY")
+                            log_state_transition(
+                                printer_name,
+                                'FINISHED',
+                                'READY',
+                                'MANUAL_RESET_DETECTED',
+                                {'api_state': api_state, 'reason': 'Manual reset detected, auto-transitioning to READY'}
+                            )
+                            updates.update(_ready_update(
+                                order_id=None, ejection_processed=False,
+                                ejection_start_time=None, finish_time=None,
+                                count_incremented_for_current_job=False,
+                            ))
+                            schedule_background_distribution(socketio, app)
+                        elif stored_state == 'EJECTING':
+                            logging.warning(f"IMPORTANT: Printer {printer_name} completed ejection (API={api_state}), transitioning from EJECTING to READY")
+                            updates.update(_ready_update(
+                                order_id=None, ejection_processed=False,
+                                ejection_start_time=None, finish_time=None,
+                                last_ejection_time=poll_time,
+                                count_incremented_for_current_job=False,
+                            ))
+                            release_ejection_lock(printer_name)
+                            clear_printer_ejection_state(printer_name)
+                        else:
+                            updates.update(_JOB_RESET, state=api_state,
+                                           status=state_map.get(api_state, 'Unknown'))
+                elif api_state not in _NO_JOB_RESET_STATES:
+                    updates.update(_JOB_RESET, finish_time=None)
+
+            printer_updates.append({
+                'index': printer_indices[idx],
+                'name': printer_name,
+                'updates': updates
+            })
 
-                # Execute pending Prusa ejection tasks
-                if updates.get('state') == 'EJECTING':
-                    with ReadLock(printers_rwlock):
-                        original_printer = PRINTERS[printer_indices[idx]]
-                        pending_ejection = original_printer.get('pending_ejection')
-
-                    if pending_ejection and printer.get('type') != 'bambu':
-                        gcode_content = pending_ejection['gcode_content']
-                        gcode_file_name = pending_ejection['gcode_file_name']
-                        headers = {"X-Api-Key": decrypt_api_key(printer['api_key'])}
-                        ejection_file_path = f"/usb/{gcode_file_name}"
-                        ejection_url = f"http://{printer['ip']}/api/v1/files{ejection_file_path}"
-
-                        ejection_tasks.append(async_send_ejection_gcode(
-                            session, printer, headers, ejection_url,
-                            gcode_content, gcode_file_name
-                        ))
-
-                        with WriteLock(printers_rwlock):
-                            if printer_indices[idx] < len(PRINTERS):
-                                PRINTERS[printer_indices[idx]]['pending_ejection'] = None
-                                logging.info(f"EJECTION: Queued pending ejection task for {printer['name']}")
-            else:
-                printer_updates.append({
-                    'index': printer_indices[idx],
-                    'updates': _offline_update(),
-                })
+            # Execute pending Prusa ejection tasks
+            if updates.get('state') == 'EJECTING' and printer.get('type') != 'bambu':
+                # The snapshot entry was resolved by this printer's name, so the request is its own
+                pending_ejection = db_printer.get('pending_ejection') if db_printer else None
+                if pending_ejection:
+                    claimed_ejections.append((db_printer['index'], printer_name, pending_ejection))
+                    gcode_content = pending_ejection['gcode_content']
+                    gcode_file_name = pending_ejection['gcode_file_name']
+                    headers = poll_headers[idx]
+                    ejection_file_path = f"/usb/{gcode_file_name}"
+                    ejection_url = f"http://{printer['ip']}/api/v1/files{ejection_file_path}"
+
+                    ejection_tasks.append(async_send_ejection_gcode(
+                        session, printer, headers, ejection_url,
+                        gcode_content, gcode_file_name
+                    ))
+                    logging.info(f"EJECTION: Queued pending ejection task for {printer_name}")
+        else:
+            printer_updates.append({
+                'index': printer_indices[idx],
+                'name': printer_name,
+                'updates': _offline_update(),
+            })
 
-        if ejection_tasks:
-            logging.info(f"EJECTION: Executing {len(ejection_tasks)} ejection tasks")
+    if ejection_tasks:
+        logging.info(f"EJECTION: Executing {len(ejection_tasks)} ejection tasks")
+        if len(ejection_tasks) == 1:
+            # Await the lone coroutine directly rather than wrapping it in a gather Task
+            try:
+                ejection_results = [await ejection_tasks[0]]
+            except Exception as e:
+                ejection_results = [e]
+        else:
             ejection_results = await asyncio.gather(*ejection_tasks, return_exceptions=True)
 
-            for i, result in enumerate(ejection_results):
-                if isinstance(result, Exception):
-                    logging.error(f"EJECTION: Task {i} failed with exception: {str(result)}")
-                else:
-                    logging.info(f"EJECTION: Task {i} completed successfully")
-        else:
-            logging.debug("EJECTION: No ejection tasks to execute")
+        for i, result in enumerate(ejection_results):
+            if isinstance(result, Exception):
+                logging.error(f"EJECTION: Task {i} failed with exception: {str(result)}")
+            else:
+                logging.info(f"EJECTION: Task {i} completed successfully")
+    else:
+        logging.debug("EJECTION: No ejection tasks to execute")
+
+    def start_bg_dist():
+        schedule_background_distribution(socketio, app)
 
-    # Apply updates and handle state transitions
+    # Apply updates and handle state transitions. Slow side effects (MQTT sends, lock
+    # releases, distribution kicks) are collected and run after the write lock is dropped.
+    after_unlock = []
     with WriteLock(printers_rwlock):
-        _apply_printer_updates(printer_updates)
+        changed = _apply_printer_updates(printer_updates)
+        changed += _clear_claimed_ejections(claimed_ejections)
 
-        def start_bg_dist():
-            threading.Timer(
-                2.0, lambda: start_background_distribution(socketio, app)
-            ).start()
+        # EJECTING/COOLING printers outside this batch (and Bambu printers fed by MQTT)
+        # still need monitoring, so every printer is checked; API updates are looked up by index.
+        api_updates = {}
+        for update in printer_updates:
+            api_updates.setdefault(update['index'], update['updates'])
 
+        ejecting_indices = []
         for i, printer in enumerate(PRINTERS):
-            if printer.get('state') == 'EJECTING':
-                _monitor_ejection_completion(printer, i, printer_updates, start_bg_dist)
-            elif printer.get('state') == 'COOLING':
-                _monitor_cooling_state(printer)
-
-        save_data(PRINTERS_FILE, PRINTERS)
+            state = printer.get('state')
+            if state == 'EJECTING':
+                ejecting_indices.append(i)
+            elif state == 'COOLING':
+                changed += _monitor_cooling_state(printer, after_unlock)
+
+        if ejecting_indices:
+            # Read every ejecting printer's state-manager entry under one lock acquisition
+            ejection_states = get_printer_ejection_states([PRINTERS[i]['name'] for i in ejecting_indices])
+            for i in ejecting_indices:
+                printer = PRINTERS[i]
+                changed += _monitor_ejection_completion(printer, i, api_updates, ejection_states[printer['name']],
+                                                        start_bg_dist, after_unlock)
+
+        # Nothing to persist when every polled field matched what was already stored.
+        # queue_save encodes here, under the lock; the disk write happens on the persistence thread.
+        if changed or bambu_changed:
+            queue_save(PRINTERS_FILE, PRINTERS)
+
+    for action in after_unlock:
+        try:
+            action()
+        except Exception as e:
+            logging.error(f"Error running post-poll action: {str(e)}")
 
-    # Load and emit current state
-    current_filament = None
-    with SafeLock(filament_lock):
-        filament_data = load_data(TOTAL_FILAMENT_FILE, {"total_filament_used_g": 0})
-        TOTAL_FILAMENT_CONSUMPTION = filament_data.get("total_filament_used_g", 0)
-        current_filament = TOTAL_FILAMENT_CONSUMPTION / 1000
-        logging.debug(f"Loaded filament data: total={TOTAL_FILAMENT_CONSUMPTION}g ({current_filament}kg)")
+    # Load and emit current state. The filament total is a published snapshot, so no lock is needed.
+    total_filament_g = get_total_filament_g()
+    current_filament = total_filament_g / 1000
+    logging.debug("Loaded filament data: total=%sg (%skg)", total_filament_g, current_filament)
 
     current_orders = None
     with SafeLock(orders_lock):
-        current_orders = copy.deepcopy(ORDERS)
+        current_orders = _copy_orders(ORDERS)
 
+    # Hold the read lock only to shallow-copy each printer; the field mapping runs unlocked
     with ReadLock(printers_rwlock):
-        printers_copy = prepare_printer_data_for_broadcast(PRINTERS)
+        raw_snapshot = [p.copy() for p in PRINTERS]
+    printers_copy = prepare_printer_data_for_broadcast(raw_snapshot)
 
     if batch_index is not None:
-        logging.debug(f"Emitting status_update with total_filament: {current_filament}kg")
-        socketio.emit('status_update', {
-            'printers': printers_copy,
-            'total_filament': current_filament,
-            'orders': current_orders
-        })
+        logging.debug("Emitting status_update with total_filament: %skg", current_filament)
+        _broadcast_poll_results(socketio, printers_copy, current_filament, current_orders)
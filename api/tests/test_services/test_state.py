@@ -7,6 +7,7 @@ Tests the services/state.py module including:
 - Thread-safe locking mechanisms
 - Order increment functions
 - Ejection state management
+- Printer name/group indexes
 """
 
 import os
@@ -45,6 +46,45 @@ class TestDataPersistence:
             loaded = json.load(f)
         assert loaded == {'new': 'data'}
 
+    def test_save_data_unicode_and_no_temp_file(self, temp_data_dir):
+        """Test that save_data round-trips non-ASCII text and cleans up its temp file."""
+        from services.state import save_data
+
+        filepath = os.path.join(temp_data_dir, 'test_unicode.json')
+        test_data = [{'name': 'Drucker Ü', 'temps': {'bed': 60.5}}]
+
+        save_data(filepath, test_data)
+
+        with open(filepath, 'r', encoding='utf-8') as f:
+            assert json.load(f) == test_data
+        assert not os.path.exists(filepath + '.tmp')
+
+    def test_queue_save_writes_latest_snapshot(self, temp_data_dir):
+        """Test that queued saves land on disk with the most recent data."""
+        from services.state import queue_save, flush_pending_saves
+
+        filepath = os.path.join(temp_data_dir, 'test_queued.json')
+
+        queue_save(filepath, {'version': 1})
+        queue_save(filepath, {'version': 2})
+        flush_pending_saves()
+
+        with open(filepath, 'r') as f:
+            assert json.load(f) == {'version': 2}
+
+    def test_save_data_supersedes_queued_save(self, temp_data_dir):
+        """Test that a direct save_data is not overwritten by an older queued snapshot."""
+        from services.state import save_data, queue_save, flush_pending_saves
+
+        filepath = os.path.join(temp_data_dir, 'test_superseded.json')
+
+        queue_save(filepath, {'stale': True})
+        save_data(filepath, {'stale': False})
+        flush_pending_saves()
+
+        with open(filepath, 'r') as f:
+            assert json.load(f) == {'stale': False}
+
     def test_load_data_existing_file(self, temp_data_dir):
         """Test loading data from existing file."""
         from services.state import load_data
@@ -58,6 +98,18 @@ class TestDataPersistence:
         loaded = load_data(filepath, [])
         assert loaded == test_data
 
+    def test_stdlib_fallback_matches_orjson_layout(self):
+        """Test the stdlib encoder writes the same 2-space layout as orjson."""
+        from services import state
+        from unittest.mock import patch
+
+        data = {'printers': [{'name': 'P1', 'temps': {'bed': 60}}], 'note': None}
+        with patch.object(state, 'orjson', None):
+            fallback = state._encode_json(data)
+        assert fallback == json.dumps(data, indent=2).encode('utf-8')
+        if state.orjson is not None:
+            assert fallback == state._encode_json(data)
+
     def test_load_data_missing_file_returns_default(self, temp_data_dir):
         """Test loading from non-existent file returns default."""
         from services.state import load_data
@@ -80,6 +132,53 @@ class TestDataPersistence:
         loaded = load_data(filepath, default)
         assert loaded == default
 
+    def test_total_filament_reread_only_when_file_changes(self, temp_data_dir):
+        """Test get_total_filament_g caches until the file's mtime/size change."""
+        from services import state
+        from unittest.mock import patch
+
+        filepath = os.path.join(temp_data_dir, 'total_filament.json')
+        with open(filepath, 'w') as f:
+            json.dump({'total_filament_used_g': 100}, f)
+
+        with patch.object(state, 'TOTAL_FILAMENT_FILE', filepath), \
+             patch.object(state, '_filament_cache', (None, 0)), \
+             patch.object(state, 'load_data', wraps=state.load_data) as mock_load:
+            assert state.get_total_filament_g() == 100
+            assert state.get_total_filament_g() == 100
+            assert mock_load.call_count == 1
+
+            with open(filepath, 'w') as f:
+                json.dump({'total_filament_used_g': 12345}, f)
+            assert state.get_total_filament_g() == 12345
+            assert mock_load.call_count == 2
+
+    def test_total_filament_same_size_rewrite_in_one_mtime_tick(self, temp_data_dir):
+        """Test a same-length save with an identical mtime is still picked up."""
+        from services import state
+        from unittest.mock import patch
+
+        filepath = os.path.join(temp_data_dir, 'total_filament.json')
+        with patch.object(state, 'TOTAL_FILAMENT_FILE', filepath), \
+             patch.object(state, '_filament_cache', (None, 0)):
+            state.save_data(filepath, {'total_filament_used_g': 1234.5})
+            mtime_ns = os.stat(filepath).st_mtime_ns
+            assert state.get_total_filament_g() == 1234.5
+
+            state.save_data(filepath, {'total_filament_used_g': 1240.1})
+            os.utime(filepath, ns=(mtime_ns, mtime_ns))
+            assert state.get_total_filament_g() == 1240.1
+
+    def test_broadcast_snapshot_reads_current_filament_total(self):
+        """Test snapshot_broadcast_state reports the saved total, not the startup value."""
+        from services import state
+        from unittest.mock import patch
+
+        with patch.object(state, 'TOTAL_FILAMENT_CONSUMPTION', 0), \
+             patch.object(state, 'get_total_filament_g', return_value=4321):
+            total_filament_g, _, _ = state.snapshot_broadcast_state()
+        assert total_filament_g == 4321
+
 
 class TestEncryption:
     """Tests for encryption/decryption functions."""
@@ -121,6 +220,25 @@ class TestEncryption:
         result = decrypt_api_key('')
         assert result is None
 
+    def test_decrypt_reuses_cached_result(self):
+        """Test repeat decrypts of the same ciphertext skip the cipher."""
+        from services import state
+
+        encrypted = state.encrypt_api_key('cached_key')
+        assert state.decrypt_api_key(encrypted) == 'cached_key'
+        hits = state._decrypt_cached.cache_info().hits
+        assert state.decrypt_api_key(encrypted) == 'cached_key'
+        assert state._decrypt_cached.cache_info().hits == hits + 1
+
+    def test_decrypt_failure_is_not_cached(self):
+        """Test invalid ciphertext is retried rather than remembered."""
+        from services import state
+
+        misses = state._decrypt_cached.cache_info().misses
+        assert state.decrypt_api_key('still_not_valid') is None
+        assert state.decrypt_api_key('still_not_valid') is None
+        assert state._decrypt_cached.cache_info().misses == misses + 2
+
 
 class TestGroupValidation:
     """Tests for group name validation and sanitization."""
@@ -239,6 +357,22 @@ class TestEjectionState:
         state = get_printer_ejection_state(printer_name)
         assert state['state'] == 'none'
 
+    def test_get_ejection_states_batch(self):
+        """Test reading several printers' ejection states in one call."""
+        from services.state import (
+            set_printer_ejection_state,
+            get_printer_ejection_states,
+            clear_printer_ejection_state
+        )
+
+        set_printer_ejection_state('batch_ejecting', 'in_progress')
+
+        states = get_printer_ejection_states(['batch_ejecting', 'batch_idle'])
+        assert states['batch_ejecting']['state'] == 'in_progress'
+        assert states['batch_idle']['state'] == 'none'
+
+        clear_printer_ejection_state('batch_ejecting')
+
     def test_ejection_paused_state(self):
         """Test global ejection paused state."""
         from services.state import get_ejection_paused, set_ejection_paused
@@ -255,6 +389,91 @@ class TestEjectionState:
         set_ejection_paused(original)
 
 
+class TestPrinterIndexes:
+    """Tests for the PRINTERS_BY_NAME / PRINTERS_BY_GROUP indexes."""
+
+    def test_rebuild_and_lookup(self, monkeypatch):
+        """Indexes reflect PRINTERS after a rebuild."""
+        import services.state as state
+
+        printers = [
+            {'name': 'P1', 'group': 'A'},
+            {'name': 'P2', 'group': 1},
+            {'name': 'P3', 'group': 'A'},
+        ]
+        monkeypatch.setattr(state, 'PRINTERS', printers)
+        monkeypatch.setattr(state, 'PRINTERS_BY_NAME', {})
+        monkeypatch.setattr(state, 'PRINTERS_BY_GROUP', {})
+
+        state.rebuild_printer_indexes()
+
+        assert state.get_printer_index('P3') == 2
+        assert state.get_printer_index('missing') is None
+        assert [p['name'] for p in state.PRINTERS_BY_GROUP['A']] == ['P1', 'P3']
+        assert state.PRINTERS_BY_GROUP['1'] == [printers[1]]
+
+    def test_stale_index_falls_back_to_scan(self, monkeypatch):
+        """A lookup still succeeds if PRINTERS changed without a rebuild."""
+        import services.state as state
+
+        printers = [{'name': 'P1'}, {'name': 'P2'}]
+        monkeypatch.setattr(state, 'PRINTERS', printers)
+        monkeypatch.setattr(state, 'PRINTERS_BY_NAME', {})
+        monkeypatch.setattr(state, 'PRINTERS_BY_GROUP', {})
+        state.rebuild_printer_indexes()
+
+        printers.pop(0)
+
+        assert state.get_printer_index('P2') == 0
+
+
+    def test_structural_changes_bump_versions(self, monkeypatch):
+        """Rebuilding printer indexes and marking orders changed advance the versions."""
+        import services.state as state
+
+        monkeypatch.setattr(state, 'PRINTERS', [])
+        monkeypatch.setattr(state, 'PRINTERS_BY_NAME', {})
+        monkeypatch.setattr(state, 'PRINTERS_BY_GROUP', {})
+        monkeypatch.setattr(state, 'ORDERS', [])
+        monkeypatch.setattr(state, 'ORDERS_BY_ID', {})
+
+        printers_before, orders_before = state.get_structure_versions()
+        state.rebuild_printer_indexes()
+        state.mark_orders_changed()
+
+        assert state.get_structure_versions() == (printers_before + 1, orders_before + 1)
+
+
+class TestOrderIndex:
+    """Tests for the ORDERS_BY_ID index."""
+
+    def test_lookup_after_mark_changed(self, monkeypatch):
+        """Orders are found by id once the index is rebuilt."""
+        import services.state as state
+
+        orders = [{'id': 1}, {'id': 'abc'}, {'id': 1, 'dup': True}]
+        monkeypatch.setattr(state, 'ORDERS', orders)
+        monkeypatch.setattr(state, 'ORDERS_BY_ID', {})
+        state.mark_orders_changed()
+
+        assert state.get_order_by_id(1) is orders[0]
+        assert state.get_order_by_id('abc') is orders[1]
+        assert state.get_order_by_id(2) is None
+
+    def test_unindexed_order_falls_back_to_scan(self, monkeypatch):
+        """An order appended without a rebuild is still found."""
+        import services.state as state
+
+        orders = [{'id': 1}]
+        monkeypatch.setattr(state, 'ORDERS', orders)
+        monkeypatch.setattr(state, 'ORDERS_BY_ID', {})
+        state.mark_orders_changed()
+
+        orders.append({'id': 2})
+
+        assert state.get_order_by_id(2) is orders[1]
+
+
 class TestGcodeValidation:
     """Tests for G-code file validation."""
 
@@ -321,14 +321,20 @@ class TestPreparePrinterDataForBroadcast:
 class TestUpdateBambuPrinterStates:
     """Verify Bambu MQTT state sync logic."""
 
-    def _run(self, printers, bambu_states):
-        """Run update_bambu_printer_states with mocked globals.  Returns save_data mock."""
+    def _run(self, printers, bambu_states, **kwargs):
+        """Run update_bambu_printer_states with mocked globals.  Returns queue_save mock.
+
+        Every printer in *bambu_states* is marked dirty, as if MQTT had just
+        reported it.
+        """
         with patch('services.status_poller.PRINTERS', printers), \
+             patch('services.state.PRINTERS', printers), \
              patch('services.status_poller.BAMBU_PRINTER_STATES', bambu_states), \
-             patch('services.status_poller.save_data') as mock_save, \
+             patch('services.status_poller.BAMBU_DIRTY', set(bambu_states)), \
+             patch('services.status_poller.queue_save') as mock_save, \
              patch('services.status_poller.PRINTERS_FILE', '/tmp/test.json'):
             from services.status_poller import update_bambu_printer_states
-            update_bambu_printer_states()
+            self.result = update_bambu_printer_states(**kwargs)
             return mock_save
 
     def test_propagates_state_and_data(self):
@@ -343,6 +349,13 @@ class TestUpdateBambuPrinterStates:
         assert printers[0]['file'] == 'test.3mf'
         mock_save.assert_called_once()
 
+    def test_save_false_reports_change_without_saving(self):
+        printers = [make_printer(name='B1', type='bambu', state='READY')]
+        mock_save = self._run(printers, {'B1': {'state': 'PRINTING'}}, save=False)
+        assert self.result is True
+        assert printers[0]['state'] == 'PRINTING'
+        mock_save.assert_not_called()
+
     def test_skips_non_bambu(self):
         printers = [make_printer(name='P1', type='prusa', state='READY')]
         self._run(printers, {'P1': {'state': 'PRINTING'}})
@@ -392,6 +405,19 @@ class TestUpdateBambuPrinterStates:
         assert printers[0]['state'] == 'EJECTING'
         assert printers[0]['manually_set'] is False
 
+    def test_only_dirty_printers_are_synced(self):
+        """Printers MQTT hasn't reported since the last sync are left alone."""
+        printers = [make_printer(name='B1', type='bambu', state='READY')]
+        with patch('services.status_poller.PRINTERS', printers), \
+             patch('services.state.PRINTERS', printers), \
+             patch('services.status_poller.BAMBU_PRINTER_STATES', {'B1': {'state': 'PRINTING'}}), \
+             patch('services.status_poller.BAMBU_DIRTY', set()), \
+             patch('services.status_poller.queue_save') as mock_save:
+            from services.status_poller import update_bambu_printer_states
+            update_bambu_printer_states()
+        assert printers[0]['state'] == 'READY'
+        mock_save.assert_not_called()
+
     def test_file_fallback_key(self):
         """Falls back to 'file' key when 'current_file' absent."""
         printers = [make_printer(name='B1', type='bambu', state='READY')]
@@ -399,6 +425,79 @@ class TestUpdateBambuPrinterStates:
         assert printers[0]['file'] == 'fallback.3mf'
 
 
+# ===========================================================================
+# fetch_status
+# ===========================================================================
+
+class TestFetchStatus:
+    """Test routing inside fetch_status."""
+
+    @pytest.mark.asyncio
+    async def test_bambu_status_runs_off_the_event_loop(self):
+        """Bambu status lookups (which may reconnect) run on a worker thread."""
+        import threading
+        from services.status_poller import fetch_status
+
+        printer = make_printer(name='B1', type='bambu')
+        loop_thread = threading.get_ident()
+        seen = {}
+
+        def _status(p):
+            seen['thread'] = threading.get_ident()
+            return p, {'printer': {'state': 'IDLE'}}
+
+        with patch('services.status_poller.get_bambu_status', side_effect=_status):
+            result = await fetch_status(MagicMock(), printer)
+
+        assert result == (printer, {'printer': {'state': 'IDLE'}})
+        assert seen['thread'] != loop_thread
+
+
+# ===========================================================================
+# _apply_printer_updates
+# ===========================================================================
+
+class TestApplyPrinterUpdates:
+    """Test how collected poll updates are written back to PRINTERS."""
+
+    def _apply(self, printers, updates):
+        from services.status_poller import _apply_printer_updates
+        with patch('services.status_poller.PRINTERS', printers), \
+             patch('services.state.PRINTERS', printers):
+            return _apply_printer_updates(updates)
+
+    def test_unchanged_fields_report_no_change(self):
+        printers = [make_printer(state='PRINTING', progress=10)]
+        changed = self._apply(printers, [{
+            'index': 0, 'name': 'Printer1',
+            'updates': {'state': 'PRINTING', 'progress': 10},
+        }])
+        assert changed == 0
+
+    def test_changed_and_new_fields_are_written(self):
+        printers = [make_printer(state='PRINTING', progress=10)]
+        changed = self._apply(printers, [{
+            'index': 0, 'name': 'Printer1',
+            'updates': {'progress': 20, 'job_id': None},
+        }])
+        assert changed == 1
+        assert printers[0]['progress'] == 20
+        assert 'job_id' in printers[0] and printers[0]['job_id'] is None
+
+    def test_failsafe_scans_whole_fleet_only_every_interval(self):
+        printers = [
+            make_printer(name='Printer1', state='READY'),
+            make_printer(name='Stuck', state='OFFLINE', manually_set=True),
+        ]
+        updates = [{'index': 0, 'name': 'Printer1', 'updates': {'state': 'READY'}}]
+        with patch('services.status_poller._failsafe_counter', 0), \
+             patch('services.status_poller.Config.FAILSAFE_INTERVAL', 2):
+            self._apply(printers, updates)
+            assert printers[1]['state'] == 'OFFLINE'
+            self._apply(printers, updates)
+            assert printers[1]['state'] == 'READY'
+
+
 # ===========================================================================
 # get_printer_status_async  (state-machine integration tests)
 # ===========================================================================
@@ -415,7 +514,7 @@ class TestStateTransitions:
 
     @staticmethod
     def _make_session_mock(job_response=None):
-        """Build aiohttp.ClientSession mock that returns *job_response* on GET.
+        """Build a shared-session mock that returns *job_response* on GET.
 
         Uses MagicMock for the session and context-manager wrapper because
         aiohttp's ``session.get(url)`` returns a context-manager object (not a
@@ -434,26 +533,25 @@ class TestStateTransitions:
         mock_get_cm.__aenter__ = AsyncMock(return_value=mock_job_resp)
         mock_get_cm.__aexit__ = AsyncMock(return_value=False)
         mock_session.get.return_value = mock_get_cm
-
-        mock_session_cm = MagicMock()
-        mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session_cm.__aexit__ = AsyncMock(return_value=False)
-        return mock_session_cm
+        return mock_session
 
     async def _run_poll(self, printers, api_responses, job_response=None,
-                        bambu_states=None, orders=None):
+                        bambu_states=None, orders=None, on_fetch=None):
         """Execute one poll cycle and return (printers, mock_socketio).
 
         *api_responses*: ``{printer_name: api_data_or_None}``
         *bambu_states*:  Optional dict to use as ``BAMBU_PRINTER_STATES``.
         *orders*:        Optional list to use as ``ORDERS``.
+        *on_fetch*:      Optional callable run inside each mocked fetch.
         """
         from services.status_poller import get_printer_status_async
 
         mock_socketio = MagicMock()
         mock_app = MagicMock()
 
-        async def _fetch(session, printer):
+        async def _fetch(session, printer, headers=None):
+            if on_fetch is not None:
+                on_fetch()
             return printer, api_responses.get(printer['name'])
 
         _bs = bambu_states if bambu_states is not None else {}
@@ -461,25 +559,23 @@ class TestStateTransitions:
              patch('services.status_poller.ORDERS', orders or []), \
              patch('services.status_poller.BAMBU_PRINTER_STATES', _bs), \
              patch('utils.status_poller_helpers.BAMBU_PRINTER_STATES', _bs), \
-             patch('services.status_poller.save_data'), \
-             patch('services.status_poller.load_data',
-                   return_value={'total_filament_used_g': 0}), \
+             patch('services.status_poller.queue_save'), \
+             patch('services.status_poller.get_total_filament_g', return_value=0), \
              patch('services.status_poller.PRINTERS_FILE', '/tmp/t.json'), \
-             patch('services.status_poller.TOTAL_FILAMENT_FILE', '/tmp/tf.json'), \
              patch('services.status_poller.clear_stuck_ejection_locks'), \
-             patch('services.status_poller.update_bambu_printer_states'), \
+             patch('services.status_poller.update_bambu_printer_states', return_value=False), \
              patch('services.status_poller.fetch_status', new=_fetch), \
              patch('services.status_poller.decrypt_api_key', return_value='k'), \
              patch('services.status_poller.handle_finished_state_ejection'), \
              patch('services.status_poller.release_ejection_lock'), \
              patch('services.status_poller.clear_printer_ejection_state'), \
-             patch('services.status_poller.get_printer_ejection_state',
-                   return_value={'state': 'none'}), \
+             patch('services.status_poller.get_printer_ejection_states',
+                   side_effect=lambda names: {n: {'state': 'none'} for n in names}), \
              patch('services.status_poller.log_api_poll_event'), \
              patch('services.status_poller.log_state_transition'), \
-             patch('aiohttp.ClientSession',
+             patch('services.status_poller.get_shared_session',
                    return_value=self._make_session_mock(job_response)), \
-             patch('threading.Timer', return_value=MagicMock()):
+             patch('services.order_distributor.schedule_background_distribution'):
             await get_printer_status_async(
                 mock_socketio, mock_app, batch_index=0, batch_size=10
             )
@@ -502,32 +598,30 @@ class TestStateTransitions:
         printers = [make_printer()]
         mock_sio = MagicMock()
 
-        async def _boom(session, printer):
+        async def _boom(session, printer, headers=None):
             raise ConnectionError("refused")
 
         with patch('services.status_poller.PRINTERS', printers), \
              patch('services.status_poller.ORDERS', []), \
              patch('services.status_poller.BAMBU_PRINTER_STATES', {}), \
              patch('utils.status_poller_helpers.BAMBU_PRINTER_STATES', {}), \
-             patch('services.status_poller.save_data'), \
-             patch('services.status_poller.load_data',
-                   return_value={'total_filament_used_g': 0}), \
+             patch('services.status_poller.queue_save'), \
+             patch('services.status_poller.get_total_filament_g', return_value=0), \
              patch('services.status_poller.PRINTERS_FILE', '/tmp/t.json'), \
-             patch('services.status_poller.TOTAL_FILAMENT_FILE', '/tmp/tf.json'), \
              patch('services.status_poller.clear_stuck_ejection_locks'), \
-             patch('services.status_poller.update_bambu_printer_states'), \
+             patch('services.status_poller.update_bambu_printer_states', return_value=False), \
              patch('services.status_poller.fetch_status', new=_boom), \
              patch('services.status_poller.decrypt_api_key', return_value='k'), \
              patch('services.status_poller.handle_finished_state_ejection'), \
              patch('services.status_poller.release_ejection_lock'), \
              patch('services.status_poller.clear_printer_ejection_state'), \
-             patch('services.status_poller.get_printer_ejection_state',
-                   return_value={'state': 'none'}), \
+             patch('services.status_poller.get_printer_ejection_states',
+                   side_effect=lambda names: {n: {'state': 'none'} for n in names}), \
              patch('services.status_poller.log_api_poll_event'), \
              patch('services.status_poller.log_state_transition'), \
-             patch('aiohttp.ClientSession',
+             patch('services.status_poller.get_shared_session',
                    return_value=self._make_session_mock()), \
-             patch('threading.Timer', return_value=MagicMock()):
+             patch('services.order_distributor.schedule_background_distribution'):
             await get_printer_status_async(mock_sio, MagicMock(), batch_index=0, batch_size=10)
 
         assert printers[0]['state'] == 'OFFLINE'
@@ -601,6 +695,30 @@ class TestStateTransitions:
         )
         assert result[0]['state'] == 'COOLING'
 
+    @pytest.mark.asyncio
+    async def test_cooled_ejection_failure_rolls_back_to_ready(self):
+        """A failed post-cooling ejection send (run after the lock) reverts to READY."""
+        printers = [make_printer(
+            name='Printer1', type='bambu', state='COOLING',
+            cooldown_target_temp=40, cooldown_order_id=1,
+            finish_time=time.time() - 60,
+        )]
+        bambu = {'Printer1': {'bed_temp': 30, 'state': 'IDLE'}}
+        orders = [{'id': 1, 'ejection_enabled': True, 'end_gcode': 'G28'}]
+        with patch('services.status_poller.send_bambu_ejection_gcode', return_value=False) as send, \
+             patch('services.state.PRINTERS', printers), \
+             patch('services.state.ORDERS', orders):
+            result, _ = await self._run_poll(
+                printers,
+                {'Printer1': make_api_response(state='IDLE', temp_bed=30)},
+                bambu_states=bambu,
+                orders=orders,
+            )
+        send.assert_called_once()
+        assert send.call_args[0][1] == 'G28'
+        assert result[0]['state'] == 'READY'
+        assert result[0]['ejection_in_progress'] is False
+
     # -- stored FINISHED + API IDLE -> READY --
 
     @pytest.mark.asyncio
@@ -628,9 +746,10 @@ class TestStateTransitions:
     @pytest.mark.asyncio
     async def test_emits_status_update(self):
         printers = [make_printer()]
-        _, mock_sio = await self._run_poll(printers, {
-            'Printer1': make_api_response(state='IDLE')
-        })
+        with patch('services.status_poller._last_broadcast_names', []):
+            _, mock_sio = await self._run_poll(printers, {
+                'Printer1': make_api_response(state='IDLE')
+            })
         mock_sio.emit.assert_called_once()
         event, payload = mock_sio.emit.call_args[0]
         assert event == 'status_update'
@@ -653,6 +772,18 @@ class TestStateTransitions:
         assert result[0]['progress'] == 42
         assert result[0]['file'] == 'widget.gcode'
 
+    @pytest.mark.asyncio
+    async def test_printing_without_job_data_clears_progress(self):
+        printers = [make_printer(state='PRINTING', progress=50, file='old.gcode')]
+        result, _ = await self._run_poll(
+            printers,
+            {'Printer1': make_api_response(state='PRINTING')},
+            job_response=None,
+        )
+        assert result[0]['state'] == 'PRINTING'
+        assert result[0]['progress'] == 0
+        assert result[0]['file'] == 'None'
+
     # -- service_mode printers are skipped --
 
     @pytest.mark.asyncio
@@ -664,3 +795,207 @@ class TestStateTransitions:
         # (they are excluded from all_printers at line 307)
         # Socket still emits but with no printer changes
         assert result[0]['state'] == 'READY'
+
+    @pytest.mark.asyncio
+    async def test_update_lands_on_printer_after_service_mode_printer(self):
+        printers = [
+            make_printer(name='Service', state='READY', service_mode=True),
+            make_printer(name='Printer2', state='READY'),
+        ]
+        result, _ = await self._run_poll(printers, {'Printer2': None})
+        # The OFFLINE update must hit Printer2, not the service-mode printer ahead of it
+        assert result[0]['state'] == 'READY'
+        assert result[1]['state'] == 'OFFLINE'
+
+    @pytest.mark.asyncio
+    async def test_reorder_during_fetch_reads_stored_fields_by_name(self):
+        printers = [
+            make_printer(name='Plain', state='OFFLINE'),
+            make_printer(name='Cooler', type='bambu', state='COOLING',
+                         cooldown_target_temp=40, finish_time=time.time() - 60),
+        ]
+
+        def _reorder():
+            # A route reorders PRINTERS while the status fetches are in flight
+            if printers[0]['name'] == 'Plain':
+                printers.reverse()
+
+        with patch('services.state.PRINTERS', printers), \
+             patch('services.state.PRINTERS_BY_NAME', {}):
+            result, _ = await self._run_poll(
+                printers,
+                {'Plain': make_api_response(state='IDLE'),
+                 'Cooler': make_api_response(state='IDLE', temp_bed=50)},
+                bambu_states={'Cooler': {'bed_temp': 50, 'state': 'IDLE'}},
+                on_fetch=_reorder,
+            )
+        by_name = {p['name']: p for p in result}
+        # Plain must not be skipped as COOLING, and Cooler must not pick up Plain's stored state
+        assert by_name['Plain']['state'] != 'OFFLINE'
+        assert by_name['Cooler']['state'] == 'COOLING'
+
+    @pytest.mark.asyncio
+    async def test_reorder_during_fetch_sends_pending_ejection_to_its_printer(self):
+        pending = {'gcode_content': 'G28', 'gcode_file_name': 'ejection_1.gcode'}
+        printers = [
+            make_printer(name='Idle', ip='10.0.0.1', state='EJECTING', ejection_in_progress=True),
+            make_printer(name='Queued', ip='10.0.0.2', state='EJECTING', ejection_in_progress=True,
+                         pending_ejection=pending),
+        ]
+
+        def _reorder():
+            if printers[0]['name'] == 'Idle':
+                printers.reverse()
+
+        send = AsyncMock(return_value=True)
+        with patch('services.state.PRINTERS', printers), \
+             patch('services.state.PRINTERS_BY_NAME', {}), \
+             patch('services.status_poller.async_send_ejection_gcode', new=send):
+            result, _ = await self._run_poll(
+                printers,
+                {'Idle': make_api_response(state='IDLE'),
+                 'Queued': make_api_response(state='IDLE')},
+                on_fetch=_reorder,
+            )
+        send.assert_called_once()
+        sent_printer, _, ejection_url = send.call_args[0][1:4]
+        assert sent_printer['name'] == 'Queued'
+        assert ejection_url.startswith('http://10.0.0.2/')
+        assert {p['name']: p for p in result}['Queued']['pending_ejection'] is None
+
+
+class TestClearClaimedEjections:
+    """Tests for clearing pending_ejection after the poll sends it."""
+
+    def _clear(self, printers, claimed):
+        from services.status_poller import _clear_claimed_ejections
+        with patch('services.status_poller.PRINTERS', printers), \
+             patch('services.state.PRINTERS', printers):
+            return _clear_claimed_ejections(claimed)
+
+    def test_sent_ejection_is_cleared(self):
+        pending = {'gcode_content': 'G28', 'gcode_file_name': 'eject.gcode'}
+        printers = [make_printer(pending_ejection=pending)]
+        assert self._clear(printers, [(0, 'Printer1', pending)]) == 1
+        assert printers[0]['pending_ejection'] is None
+
+    def test_newer_ejection_is_kept(self):
+        sent = {'gcode_content': 'G28', 'gcode_file_name': 'eject.gcode'}
+        newer = {'gcode_content': 'G28 X', 'gcode_file_name': 'eject.gcode'}
+        printers = [make_printer(name='Other'), make_printer(pending_ejection=newer)]
+        # Index is stale (printer moved); lookup goes by name and keeps the newer request
+        assert self._clear(printers, [(0, 'Printer1', sent)]) == 0
+        assert printers[1]['pending_ejection'] is newer
+
+
+class TestMonitorCoolingState:
+    """Tests for _monitor_cooling_state change reporting."""
+
+    def test_unchanged_cooling_status_reports_no_change(self):
+        from services.status_poller import _monitor_cooling_state
+        printer = make_printer(state='COOLING', type='bambu', cooldown_target_temp=40,
+                               status='Cooling (60°C → 40°C)', finish_time=time.time())
+        with patch.dict('services.status_poller.BAMBU_PRINTER_STATES', {'Printer1': {'bed_temp': 60}}):
+            after_unlock = []
+            assert _monitor_cooling_state(printer, after_unlock) is False
+            assert after_unlock == []
+
+
+class TestCopyOrders:
+    """Tests for _copy_orders."""
+
+    def test_copy_is_detached_from_orders(self):
+        from services.status_poller import _copy_orders
+        orders = [{'id': 1, 'sent': 0, 'groups': ['A']}]
+        copied = _copy_orders(orders)
+        orders[0]['sent'] = 1
+        orders[0]['groups'].append('B')
+        assert copied == [{'id': 1, 'sent': 0, 'groups': ['A']}]
+
+
+class TestBroadcastPollResults:
+    """Tests for _broadcast_poll_results full snapshots vs deltas."""
+
+    def _broadcast(self, printers, total_filament=1.0, orders=None):
+        mock_sio = MagicMock()
+        from services.status_poller import _broadcast_poll_results
+        _broadcast_poll_results(mock_sio, printers, total_filament, orders or [])
+        return mock_sio
+
+    @pytest.fixture(autouse=True)
+    def _reset_broadcast_state(self):
+        with patch('services.status_poller._last_broadcast_names', None), \
+             patch('services.status_poller._last_broadcast_printers', {}), \
+             patch('services.status_poller._last_broadcast_extras', {}), \
+             patch('services.status_poller._polls_since_full_broadcast', 0), \
+             patch('services.status_poller.Config.FULL_BROADCAST_INTERVAL', 100):
+            yield
+
+    def test_first_broadcast_is_full_snapshot(self):
+        mock_sio = self._broadcast([{'name': 'P1', 'state': 'READY'}])
+        mock_sio.emit.assert_called_once()
+        event, payload = mock_sio.emit.call_args[0]
+        assert event == 'status_update'
+        assert payload['printers'] == [{'name': 'P1', 'state': 'READY'}]
+
+    def test_unchanged_poll_emits_nothing(self):
+        self._broadcast([{'name': 'P1', 'state': 'READY'}])
+        mock_sio = self._broadcast([{'name': 'P1', 'state': 'READY'}])
+        mock_sio.emit.assert_not_called()
+
+    def test_changed_printer_emits_only_changed_fields(self):
+        self._broadcast([{'name': 'P1', 'state': 'READY', 'nozzle_temp': 25},
+                         {'name': 'P2', 'state': 'READY', 'nozzle_temp': 25}])
+        mock_sio = self._broadcast([{'name': 'P1', 'state': 'PRINTING', 'nozzle_temp': 25},
+                                    {'name': 'P2', 'state': 'READY', 'nozzle_temp': 25}])
+        mock_sio.emit.assert_called_once_with(
+            'status_update', {'printer_deltas': [{'name': 'P1', 'state': 'PRINTING'}]}
+        )
+
+    def test_deltas_and_orders_share_one_frame(self):
+        self._broadcast([{'name': 'P1', 'state': 'READY'}, {'name': 'P2', 'state': 'READY'}],
+                        orders=[{'id': 1, 'sent': 0}])
+        mock_sio = self._broadcast([{'name': 'P1', 'state': 'PRINTING'}, {'name': 'P2', 'state': 'OFFLINE'}],
+                                   orders=[{'id': 1, 'sent': 1}])
+        mock_sio.emit.assert_called_once()
+        event, payload = mock_sio.emit.call_args[0]
+        assert event == 'status_update'
+        assert payload['orders'] == [{'id': 1, 'sent': 1}]
+        assert [d['name'] for d in payload['printer_deltas']] == ['P1', 'P2']
+
+    def test_changed_orders_sent_without_printers(self):
+        self._broadcast([{'name': 'P1'}], orders=[{'id': 1, 'sent': 0}])
+        mock_sio = self._broadcast([{'name': 'P1'}], orders=[{'id': 1, 'sent': 1}])
+        mock_sio.emit.assert_called_once_with('status_update', {'orders': [{'id': 1, 'sent': 1}]})
+
+    def test_printer_list_change_forces_full_snapshot(self):
+        self._broadcast([{'name': 'P1'}])
+        mock_sio = self._broadcast([{'name': 'P1'}, {'name': 'P2'}])
+        event, payload = mock_sio.emit.call_args[0]
+        assert event == 'status_update'
+        assert len(payload['printers']) == 2
+
+    def test_removed_field_listed_in_removed(self):
+        self._broadcast([{'name': 'P1', 'state': 'ERROR', 'error_message': 'Nozzle clog'}])
+        mock_sio = self._broadcast([{'name': 'P1', 'state': 'READY'}])
+        mock_sio.emit.assert_called_once_with(
+            'status_update', {'printer_deltas': [{'name': 'P1', 'state': 'READY', 'removed': ['error_message']}]}
+        )
+
+    def test_field_becoming_none_sent_as_value(self):
+        self._broadcast([{'name': 'P1', 'state': 'FINISHED', 'job_id': 7}])
+        mock_sio = self._broadcast([{'name': 'P1', 'state': 'READY', 'job_id': None}])
+        mock_sio.emit.assert_called_once_with(
+            'status_update', {'printer_deltas': [{'name': 'P1', 'state': 'READY', 'job_id': None}]}
+        )
+
+    def test_full_status_from_elsewhere_forces_full_snapshot(self):
+        from services.status_poller import emit_full_status
+        self._broadcast([{'name': 'P1', 'state': 'READY'}])
+        route_sio = MagicMock()
+        emit_full_status(route_sio, {'printers': [{'name': 'P1', 'state': 'FINISHED'}]})
+        route_sio.emit.assert_called_once_with('status_update', {'printers': [{'name': 'P1', 'state': 'FINISHED'}]})
+        mock_sio = self._broadcast([{'name': 'P1', 'state': 'READY'}])
+        event, payload = mock_sio.emit.call_args[0]
+        assert event == 'status_update'
+        assert payload['printers'] == [{'name': 'P1', 'state': 'READY'}]
@@ -70,8 +70,11 @@ class Config:
 
     # UPDATED TIMEOUTS: Reduced to prevent deadlocks
     API_TIMEOUT = 15  # Reduced from 20 to 15 seconds
+    API_CONNECT_TIMEOUT = 2  # Seconds to open a connection to a printer on the LAN
     UPLOAD_TIMEOUT = 45  # Reduced from 60 to 45 seconds
     STATUS_REFRESH_INTERVAL = 10  # Seconds
+    FAILSAFE_INTERVAL = 10  # Polls between full manually_set failsafe scans
+    FULL_BROADCAST_INTERVAL = 6  # Polls between full status_update snapshots (deltas in between)
     CACHE_TTL = 10  # Seconds
 
     # LOCK TIMEOUTS: New configuration for lock management
@@ -163,6 +166,7 @@ class Config:
         """Get timeout configuration for easy access"""
         return {
             'api_timeout': cls.API_TIMEOUT,
+            'api_connect_timeout': cls.API_CONNECT_TIMEOUT,
             'upload_timeout': cls.UPLOAD_TIMEOUT,
             'read_lock_timeout': cls.READ_LOCK_TIMEOUT,
             'write_lock_timeout': cls.WRITE_LOCK_TIMEOUT,
@@ -6,49 +6,114 @@ from a single global).  They are extracted here to keep status_poller.py
 focused on orchestration and mutable-state management.
 """
 import time
-import copy
+import functools
+from types import MappingProxyType
 
 from services.state import logging
 from services.bambu_handler import BAMBU_PRINTER_STATES, bambu_states_lock
 
-# State mapping for printer states
-state_map = {
+# State mapping for printer states (read-only view; built once at import)
+state_map = MappingProxyType({
     'IDLE': 'Ready', 'PRINTING': 'Printing', 'PAUSED': 'Paused', 'ERROR': 'Error',
     'FINISHED': 'Finished', 'READY': 'Ready', 'STOPPED': 'Stopped', 'ATTENTION': 'Attention',
     'EJECTING': 'Ejecting', 'PREPARE': 'Preparing', 'OFFLINE': 'Offline',
     'COOLING': 'Cooling'
-}
+})
+
+# Constant update templates. Helpers and callers copy or merge these, never mutate them.
+_JOB_CLEARED = MappingProxyType({"progress": 0, "time_remaining": 0, "file": "None", "job_id": None})
+_JOB_RESET = MappingProxyType({
+    **_JOB_CLEARED,
+    "manually_set": False, "ejection_in_progress": False,
+    "count_incremented_for_current_job": False,
+})
+_OFFLINE_BASE = MappingProxyType({
+    **_JOB_RESET,
+    "state": "OFFLINE", "status": "Offline", "finish_time": None,
+})
+_READY_BASE = MappingProxyType({
+    "state": "READY", "status": "Ready",
+    "progress": 0, "time_remaining": 0,
+    "file": None, "job_id": None,
+    "manually_set": True,
+    "ejection_in_progress": False,
+})
+_EJECTING_BASE = MappingProxyType({
+    "state": "EJECTING", "status": "Ejecting",
+    "progress": 0, "time_remaining": 0,
+    "job_id": None,
+    "manually_set": False,
+})
 
 
 def get_minutes_since_finished(printer):
     """Calculate minutes elapsed since printer entered FINISHED state"""
-    logging.debug(f"Checking finish time for {printer.get('name')}: "
-                  f"state={printer.get('state')}, finish_time={printer.get('finish_time')}")
+    name = printer.get('name')
+    state = printer.get('state')
+    finish_time = printer.get('finish_time')
+    logging.debug("Checking finish time for %s: state=%s, finish_time=%s", name, state, finish_time)
 
-    if printer.get('state') != 'FINISHED' or not printer.get('finish_time'):
+    if state != 'FINISHED' or not finish_time:
         return None
 
-    current_time = time.time()
-    finish_time = printer.get('finish_time', current_time)
-    elapsed_seconds = current_time - finish_time
-
+    elapsed_seconds = time.time() - finish_time
     minutes = int(elapsed_seconds / 60)
 
-    logging.debug(f"Timer for {printer.get('name')}: {minutes} minutes")
+    logging.debug("Timer for %s: %s minutes", name, minutes)
     return minutes
 
 
+@functools.lru_cache(maxsize=256)
+def _print_stage(state, progress, minutes_since_finished, cooldown_target, error_message):
+    """Return (print_stage, stage_detail) for a printer state.
+
+    Arguments that the state does not use are passed as None, so repeated
+    broadcasts of unchanged printers hit the cache.
+    """
+    if state == 'PRINTING':
+        return 'printing', f"{progress}% complete"
+    if state == 'FINISHED':
+        if minutes_since_finished is not None:
+            return 'finished', f'Finished {minutes_since_finished}m ago'
+        return 'finished', 'Print complete'
+    if state == 'EJECTING':
+        return 'ejecting', 'Ejecting print'
+    if state == 'COOLING':
+        return 'cooling', f'Cooling bed to {cooldown_target}°C'
+    if state == 'READY':
+        return 'ready', 'Ready for next job'
+    if state == 'PAUSED':
+        return 'paused', 'Print paused'
+    if state == 'ERROR':
+        return 'error', error_message
+    return 'idle', ''
+
+
 def prepare_printer_data_for_broadcast(printers):
-    """Prepare printer data with calculated fields for broadcasting"""
-    printers_copy = copy.deepcopy(printers)
+    """Prepare printer data with calculated fields for broadcasting
+
+    Printers are copied one level deep: only top-level fields are written
+    below, and nested values such as ``temps`` are only read.
+    """
+    printers_copy = [dict(p) for p in printers]
+
+    # Snapshot the MQTT state of every Bambu printer under one lock acquisition
+    bambu_names = {p.get('name') for p in printers_copy if p.get('type') == 'bambu'}
+    bambu_snapshot = {}
+    if bambu_names:
+        with bambu_states_lock:
+            bambu_snapshot = {name: dict(BAMBU_PRINTER_STATES[name])
+                              for name in bambu_names if name in BAMBU_PRINTER_STATES}
 
     for printer in printers_copy:
+        state = printer.get('state', 'Unknown')
+
         # Map backend field names to frontend expected names
         if 'file' in printer:
-            printer['current_file'] = printer.get('file')
+            printer['current_file'] = printer['file']
 
         if 'state' in printer:
-            printer['status'] = printer.get('state')
+            printer['status'] = state
 
         # Extract temperature values
         temps = printer.get('temps', {})
@@ -60,28 +125,24 @@ def prepare_printer_data_for_broadcast(printers):
         if 'bed_temp' in printer and printer['bed_temp']:
             bed_temp = printer['bed_temp']
 
-        # Check Bambu MQTT state directly for real-time temps and error info
-        if printer.get('type') == 'bambu':
-            printer_name = printer.get('name')
-            if printer_name:
-                with bambu_states_lock:
-                    if printer_name in BAMBU_PRINTER_STATES:
-                        bambu_state = BAMBU_PRINTER_STATES[printer_name]
-                        if bambu_state.get('nozzle_temp') is not None:
-                            nozzle_temp = bambu_state.get('nozzle_temp', 0)
-                        if bambu_state.get('bed_temp') is not None:
-                            bed_temp = bambu_state.get('bed_temp', 0)
-
-                        if bambu_state.get('state') == 'ERROR' or printer.get('state') == 'ERROR':
-                            error_msg = bambu_state.get('error')
-                            hms_alerts = bambu_state.get('hms_alerts', [])
-
-                            if error_msg:
-                                printer['error_message'] = error_msg
-                            elif hms_alerts:
-                                printer['error_message'] = '; '.join(hms_alerts)
-                            else:
-                                printer['error_message'] = 'Unknown error'
+        # Use the Bambu MQTT snapshot for real-time temps and error info
+        bambu_state = bambu_snapshot.get(printer.get('name')) if bambu_snapshot and printer.get('type') == 'bambu' else None
+        if bambu_state is not None:
+            if bambu_state.get('nozzle_temp') is not None:
+                nozzle_temp = bambu_state.get('nozzle_temp', 0)
+            if bambu_state.get('bed_temp') is not None:
+                bed_temp = bambu_state.get('bed_temp', 0)
+
+            if bambu_state.get('state') == 'ERROR' or state == 'ERROR':
+                error_msg = bambu_state.get('error')
+                hms_alerts = bambu_state.get('hms_alerts', [])
+
+                if error_msg:
+                    printer['error_message'] = error_msg
+                elif hms_alerts:
+                    printer['error_message'] = '; '.join(hms_alerts)
+                else:
+                    printer['error_message'] = 'Unknown error'
 
         printer['nozzle_temp'] = nozzle_temp
         printer['bed_temp'] = bed_temp
@@ -91,43 +152,17 @@ def prepare_printer_data_for_broadcast(printers):
         printer['minutes_since_finished'] = minutes_since_finished
 
         # Add print stage info
-        state = printer.get('state', 'Unknown')
-        print_stage = 'idle'
-        stage_detail = ''
-
-        if state == 'PRINTING':
-            print_stage = 'printing'
-            stage_detail = f"{printer.get('progress', 0)}% complete"
-        elif state == 'FINISHED':
-            print_stage = 'finished'
-            if minutes_since_finished is not None:
-                stage_detail = f'Finished {minutes_since_finished}m ago'
-            else:
-                stage_detail = 'Print complete'
-        elif state == 'EJECTING':
-            print_stage = 'ejecting'
-            stage_detail = 'Ejecting print'
-        elif state == 'COOLING':
-            print_stage = 'cooling'
-            cooldown_target = printer.get('cooldown_target_temp', 0)
-            stage_detail = f'Cooling bed to {cooldown_target}°C'
-        elif state == 'READY':
-            print_stage = 'ready'
-            stage_detail = 'Ready for next job'
-        elif state == 'PAUSED':
-            print_stage = 'paused'
-            stage_detail = 'Print paused'
-        elif state == 'ERROR':
-            print_stage = 'error'
-            stage_detail = printer.get('error_message', 'Printer error')
-
-        printer['print_stage'] = print_stage
-        printer['stage_detail'] = stage_detail
-
-        # Add timestamps for timeline tracking
-        printer['print_started_at'] = printer.get('print_started_at')
-        printer['finish_time'] = printer.get('finish_time')
-        printer['ejection_start_time'] = printer.get('ejection_start_time')
+        printer['print_stage'], printer['stage_detail'] = _print_stage(
+            state,
+            printer.get('progress', 0) if state == 'PRINTING' else None,
+            minutes_since_finished if state == 'FINISHED' else None,
+            printer.get('cooldown_target_temp', 0) if state == 'COOLING' else None,
+            printer.get('error_message', 'Printer error') if state == 'ERROR' else None,
+        )
+
+        # Add timestamps for timeline tracking (present as None when unset)
+        for key in ('print_started_at', 'finish_time', 'ejection_start_time'):
+            printer.setdefault(key, None)
 
     return printers_copy
 
@@ -160,13 +195,7 @@ def _build_minimal_printer(printer):
 
 def _offline_update():
     """Standard update dict for an unreachable / offline printer."""
-    return {
-        "state": "OFFLINE", "status": "Offline",
-        "temps": {"nozzle": 0, "bed": 0},
-        "progress": 0, "time_remaining": 0, "file": "None", "job_id": None,
-        "manually_set": False, "ejection_in_progress": False,
-        "finish_time": None, "count_incremented_for_current_job": False,
-    }
+    return {**_OFFLINE_BASE, "temps": {"nozzle": 0, "bed": 0}}
 
 
 def _ready_update(**overrides):
@@ -175,15 +204,15 @@ def _ready_update(**overrides):
     Contains only the universally-common fields.  Callers add extras
     (temps, order_id, ejection_processed, finish_time, etc.) via *overrides*.
     """
-    base = {
-        "state": "READY", "status": "Ready",
-        "progress": 0, "time_remaining": 0,
-        "file": None, "job_id": None,
-        "manually_set": True,
-        "ejection_in_progress": False,
-    }
-    base.update(overrides)
-    return base
+    return {**_READY_BASE, **overrides}
+
+
+def _ejecting_update(**overrides):
+    """Base update dict for holding a printer in EJECTING state.
+
+    Callers add temps, file and the ejection flags via *overrides*.
+    """
+    return {**_EJECTING_BASE, **overrides}
 
 
 def _api_temps(data):
@@ -23,6 +23,26 @@ export function initSocket(queryClient: QueryClient) {
   socket.on('status_update', (data) => {
     if (data.printers) {
       queryClient.setQueryData(['printers'], data.printers)
+    } else if (data.printer_deltas) {
+      // Partial updates for changed printers only, keyed by name
+      const deltas = new Map<string, Record<string, unknown>>(
+        data.printer_deltas.map((d: { name: string }) => [d.name, d])
+      )
+      queryClient.setQueryData(['printers'], (old: unknown) => {
+        if (!Array.isArray(old)) return old
+        return old.map((p) => {
+          const printer = p as { name: string }
+          const delta = deltas.get(printer.name)
+          if (!delta) return printer
+          // `removed` lists fields the server no longer sends for this printer
+          const { removed, ...changes } = delta as { removed?: string[] }
+          const merged: Record<string, unknown> = { ...printer, ...changes }
+          for (const key of removed ?? []) {
+            delete merged[key]
+          }
+          return merged
+        })
+      })
     }
     if (data.orders) {
       // Only update if no mutation is in progress to avoid flickering during drag-drop